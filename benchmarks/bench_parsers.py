@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark of issue body parsing.
+
+Compares the parser registry against the previous implementation, which ran
+an uncompiled regex for detection and again for extraction and split table
+bodies into section copies. Both must produce identical results.
+
+Usage:
+    python benchmarks/bench_parsers.py [--snapshot .cache/issues.json] [--repeat 2000] [--rounds 7]
+
+By default the bodies in ``benchmarks/corpus/issue_bodies.json`` are used;
+``--snapshot`` reads the real issue bodies of an incremental sync snapshot.
+"""
+
+import argparse
+import json
+import logging
+import re
+import sys
+import timeit
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from src.parsers import ParserRegistry, TableParser  # noqa: E402
+
+logger = logging.getLogger("bench_parsers")
+
+CORPUS = Path(__file__).resolve().parent / "corpus" / "issue_bodies.json"
+
+
+JSON_BLOCK = r"```json([\s\S]+?)```"
+
+
+def legacy_parse(issue_data):
+    """The parsing logic before the registry, kept as the reference."""
+    body = issue_data.get("body", "")
+    
+    # JsonParser.can_parse / JsonParser.parse
+    if re.findall(JSON_BLOCK, body):
+        try:
+            json_matches = re.findall(JSON_BLOCK, body)
+            json_str = json_matches[0].strip()
+            if json_str:
+                result = dict(json.loads(json_str), **{"raw": issue_data})
+                logger.debug(f"Successfully parsed JSON from issue #{issue_data.get('number')}")
+                return result
+        except Exception as e:
+            logger.error(f"Invalid JSON in issue #{issue_data.get('number')}: {e}")
+    
+    # TableParser.can_parse / TableParser.parse
+    if "###" in body:
+        raw_data = {}
+        for section in body.strip().split("###"):
+            if not section.strip():
+                continue
+            section = section.replace("\r\n", "\n")
+            parts = section.split("\n\n")
+            if len(parts) < 2:
+                continue
+            raw_data[parts[0].strip()] = parts[1].strip()
+        
+        result = {}
+        for eng_key, chi_key in TableParser.FIELD_MAPPING.items():
+            value = raw_data.get(chi_key, "").strip()
+            result[eng_key] = "" if value == "_No response_" else value
+        result = dict(result, **{"raw": issue_data})
+        logger.debug(f"Successfully parsed table from issue #{issue_data.get('number')}")
+        return result
+    return None
+
+
+def load_bodies(snapshot):
+    if snapshot:
+        with open(snapshot, "r", encoding="utf-8") as file:
+            return [issue.get("body") or "" for issue in json.load(file)["issues"].values()]
+    with open(CORPUS, "r", encoding="utf-8") as file:
+        return json.load(file)["bodies"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--snapshot", help="issues.json snapshot to read bodies from")
+    parser.add_argument("--repeat", type=int, default=2000, help="passes over the corpus per round")
+    parser.add_argument("--rounds", type=int, default=7, help="timed rounds, the fastest is reported")
+    args = parser.parse_args()
+    
+    # Parsers log failures of intentionally broken bodies; keep the output clean
+    logging.disable(logging.CRITICAL)
+    
+    issues = [{"number": number, "body": body} for number, body in enumerate(load_bodies(args.snapshot), 1)]
+    registry = ParserRegistry()
+    
+    mismatches = [issue["number"] for issue in issues if registry.parse(issue) != legacy_parse(issue)]
+    if mismatches:
+        print(f"Results differ for issues {mismatches}")
+        return 1
+    
+    def run(parse):
+        for issue in issues:
+            parse(issue)
+    
+    print(f"{len(issues)} bodies x {args.repeat} passes")
+    candidates = {"legacy": legacy_parse, "registry": registry.parse}
+    timings = {name: float("inf") for name in candidates}
+    # Interleave the rounds so drift in machine load affects both alike
+    for _ in range(args.rounds):
+        for name, parse in candidates.items():
+            timings[name] = min(timings[name], timeit.timeit(lambda: run(parse), number=args.repeat))
+    
+    for name, seconds in timings.items():
+        print(f"{name:>8}: {seconds * 1e6 / (args.repeat * len(issues)):8.2f} us/body")
+    print(f" speedup: {timings['legacy'] / timings['registry']:.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,14 +2,35 @@
 Main entry point for Hexo Friendly Links Generator.
 """
 
-import json
 import os
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Sequence, Set
 
-from .utils import setup_logger, load_config
-from .services import GitHubService, LinkChecker, RSSService, AvatarOptimizer
-from .parsers import JsonParser, TableParser
+from .utils import (
+    setup_logger,
+    load_config,
+    create_session,
+    HostLimitedExecutor,
+    HttpCache,
+    IssueSnapshot,
+    GroupIndex,
+    LinkHealthStore,
+    load_json,
+    OutputWriter,
+)
+from .services import (
+    GitHubService,
+    LinkChecker,
+    RSSService,
+    AvatarOptimizer,
+    AvatarThumbnailer,
+    AvatarSpriteBuilder,
+    RateLimitExceeded,
+    RateLimitScheduler,
+    TimelineBuilder,
+    FeedSlimmer,
+)
+from .parsers import JsonParser, ParseCache, ParserRegistry, TableParser
 
 # Version from package
 from . import __version__
@@ -21,6 +42,9 @@ logger = setup_logger(__name__)
 class FriendlyLinksGenerator:
     """Main generator class for processing friendly links."""
     
+    # Entry fields filled from homepage discovery, and the probe key they use
+    DISCOVERED_FIELDS = {"url-feed": "feed", "avatar": "icon"}
+    
     def __init__(self, config_path: str = "config.yml"):
         """
         Initialize the generator.
@@ -29,13 +53,104 @@ class FriendlyLinksGenerator:
             config_path: Path to configuration file
         """
         self.config = load_config(config_path)
-        self.github_service = GitHubService()
-        self.link_checker = LinkChecker()
-        self.rss_service = RSSService()
-        self.avatar_optimizer = AvatarOptimizer()
+        self.cache_dir = Path(self.config.cache.dir)
+        http_cache = HttpCache(self.cache_dir / "github_http.json") if self.config.cache.enabled else None
+        
+        # One pooled session shared by every service
+        network = self.config.network
+        self.http = create_session(
+            pool_size=max(network.pool_size, network.per_host_limit, self.config.issues.page_workers),
+            retries=network.retries,
+            backoff_factor=network.backoff_factor
+        )
+        
+        self.github_service = GitHubService(
+            cache=http_cache,
+            page_workers=self.config.issues.page_workers,
+            scheduler=RateLimitScheduler(max_wait=self.config.issues.rate_limit_wait),
+            session=self.http
+        )
+        
+        links = self.config.links
+        self.link_health = None
+        if links.health_cache and self.config.cache.enabled:
+            self.link_health = LinkHealthStore(
+                self.cache_dir / "link_health.json",
+                ttl=links.ttl,
+                max_ttl=links.max_ttl,
+                retry_interval=links.retry_interval
+            )
+        
+        self.link_checker = LinkChecker(
+            session=self.http,
+            health_store=self.link_health,
+            max_probe_bytes=links.probe_max_bytes
+        )
+        
+        feed_cache = None
+        if self.config.feeds.conditional and self.config.cache.enabled:
+            feed_cache = HttpCache(self.cache_dir / "feeds.json")
+        feeds = self.config.feeds
+        self.rss_service = RSSService(
+            cache=feed_cache,
+            session=self.http,
+            streaming=feeds.streaming,
+            max_bytes=feeds.max_bytes,
+            timeout=feeds.timeout
+        )
+        self.feed_slimmer = None
+        if feeds.slim.enabled:
+            slim = feeds.slim
+            self.feed_slimmer = FeedSlimmer(
+                strip_html=slim.strip_html,
+                summary_length=slim.summary_length,
+                iso_dates=slim.iso_dates,
+                drop_fields=slim.drop_fields,
+                drop_empty=slim.drop_empty,
+                dedupe=slim.dedupe
+            )
+        
+        # Avatar checks are cached like link checks, in their own file
+        self.avatar_health = None
+        if links.health_cache and self.config.cache.enabled:
+            self.avatar_health = LinkHealthStore(
+                self.cache_dir / "avatar_health.json",
+                ttl=links.ttl,
+                max_ttl=links.max_ttl,
+                retry_interval=links.retry_interval
+            )
+        self.avatar_optimizer = AvatarOptimizer(session=self.http, health_store=self.avatar_health)
+        
+        # Issue numbers of the entries of each group of the last process_issues
+        # call, in the same order; they outlive the raw data
+        self.entry_ids: Dict[str, List[int]] = {}
+        
+        # Content-addressed avatar thumbnails, kept in the cache between runs
+        avatars = self.config.output.avatars
+        self.avatar_thumbnailer = None
+        self.thumbnails: Set[str] = set()
+        
+        if avatars.thumbnails:
+            self.avatar_thumbnailer = AvatarThumbnailer(
+                self.cache_dir / "avatars",
+                cache=HttpCache(self.cache_dir / "avatars.json") if self.config.cache.enabled else None,
+                session=self.http,
+                size=avatars.size,
+                image_format=avatars.format,
+                quality=avatars.quality,
+                max_bytes=avatars.max_bytes
+            )
+            if not self.avatar_thumbnailer.available:
+                logger.warning("Pillow is not installed, avatar thumbnails are disabled")
+                self.avatar_thumbnailer = None
+        if avatars.sprites and not self.avatar_thumbnailer:
+            logger.warning("Avatar sprites are packed from thumbnails, enable output.avatars.thumbnails")
         
         # Initialize parsers
-        self.parsers = [JsonParser, TableParser]
+        self.parsers = ParserRegistry([JsonParser, TableParser])
+        self.parse_cache = None
+        if self.config.issues.parse_cache and self.config.cache.enabled:
+            self.parse_cache = ParseCache(self.cache_dir / "parsed.json", version=self.parsers.version)
     
     def parse_issue(self, issue_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -43,18 +158,19 @@ class FriendlyLinksGenerator:
         
         Args:
             issue_data: GitHub issue data
-            
+        
         Returns:
             Parsed friendly link data
         """
-        body = issue_data.get("body", "")
-        
-        # Try each parser until one works
-        for parser_class in self.parsers:
-            if parser_class.can_parse(body):
-                result = parser_class.parse(issue_data)
-                if result:
-                    return result
+        # Reuse the result of an earlier run if neither the issue nor the parsers changed
+        result = self.parse_cache.get(issue_data) if self.parse_cache else None
+        if result is None:
+            # Try each parser until one works
+            result = self.parsers.parse(issue_data)
+            if self.parse_cache:
+                self.parse_cache.put(issue_data, result)
+        if result:
+            return result
         
         # If no parser worked, log warning and return basic structure
         logger.warning(f"Could not parse issue #{issue_data.get('number')}")
@@ -64,54 +180,41 @@ class FriendlyLinksGenerator:
         """
         Process all issues and generate grouped results.
         
+        The issue numbers of the entries of each group are kept in
+        ``entry_ids``.
+        
         Returns:
             Dictionary with grouped friendly links data
         """
         logger.info("Starting to process issues...")
         
         # Get all issues from repository
-        all_issues = self.github_service.get_issues(
-            repo=self.config.issues.repo,
-            state="all",
-            sort=self.config.issues.sort
-        )
+        all_issues = self._fetch_issues()
+        self._log_api_budget()
         
         # Parse all issues
-        parsed_issues = []
-        for issue in all_issues:
-            parsed_issue = self.parse_issue(issue)
-            parsed_issues.append(parsed_issue)
+        parsed_issues = [self.parse_issue(issue) for issue in all_issues]
+        numbers = [issue.get("number") for issue in all_issues]
+        if self.parse_cache:
+            logger.info(f"Reused {self.parse_cache.hits} of {len(all_issues)} cached parse results")
+            self.parse_cache.save()
         
         # Check link status, get RSS content, and optimize avatars for all parsed issues
-        for issue in parsed_issues:
-            # Check link status if URL exists (matching original logic)
-            if "url" in issue and issue["url"]:
-                try:
-                    # Use requests.head directly like original code for consistency
-                    import requests
-                    requests.head(issue["url"], timeout=5)
-                    issue["status"] = "active"
-                except:
-                    issue["status"] = "404"
-            
-            # Get RSS content if feed URL exists  
-            if "url-feed" in issue and issue["url-feed"]:
-                issue["rss"] = self.rss_service.get_feed_content(issue["url-feed"])
-            
-            # Optimize avatar for better frontend loading
-            if "avatar" in issue:
-                issue = self.avatar_optimizer.optimize_avatar(issue)
+        self._probe_issues(parsed_issues)
         
         logger.info(f"Processed {len(parsed_issues)} issues")
         
         # Generate output groups
         output = {"all": parsed_issues}
+        self.entry_ids = {"all": numbers}
         
         # Process configured groups
+        index = GroupIndex(parsed_issues)
         for group_config in self.config.issues.groups:
-            filtered_issues = self._filter_issues_for_group(parsed_issues, group_config)
-            output[group_config.name] = filtered_issues
-            logger.info(f"Group '{group_config.name}': {len(filtered_issues)} issues")
+            positions = self._group_positions(index, group_config)
+            output[group_config.name] = [parsed_issues[position] for position in positions]
+            self.entry_ids[group_config.name] = [numbers[position] for position in positions]
+            logger.info(f"Group '{group_config.name}': {len(positions)} issues")
         
         # Remove raw data if configured (after all grouping is done)
         if not self.config.issues.keep_raw:
@@ -119,62 +222,460 @@ class FriendlyLinksGenerator:
         
         return output
     
-    def _filter_issues_for_group(self, issues: List[Dict[str, Any]], group_config) -> List[Dict[str, Any]]:
-        """Filter issues based on group configuration."""
-        filtered = issues
-        
-        # Filter by state
-        if group_config.state != "all":
-            filtered = [
-                issue for issue in filtered
-                if issue.get("raw", {}).get("state") == group_config.state
-            ]
-        
-        # Filter by labels
-        if group_config.labels:
-            required_labels = set(group_config.labels)
-            filtered = [
-                issue for issue in filtered
-                if required_labels.issubset(
-                    set(label["name"] for label in issue.get("raw", {}).get("labels", []))
-                )
-            ]
-        
-        return filtered
+    def _fetch_issues(self) -> List[Dict[str, Any]]:
+        """
+        Fetch all repository issues, incrementally if configured.
+        
+        In incremental mode only issues updated since the last sync are
+        downloaded and merged into the local snapshot.
+        """
+        issues_config = self.config.issues
+        fetch = self.github_service.get_issues
+        if issues_config.backend == "graphql":
+            if self.github_service.authenticated:
+                fetch = self.github_service.get_issues_graphql
+            else:
+                logger.warning("GraphQL backend requires GITHUB_TOKEN, falling back to REST")
+        
+        if not (issues_config.incremental and self.config.cache.enabled):
+            return fetch(
+                repo=issues_config.repo,
+                state="all",
+                sort=issues_config.sort
+            )
+        
+        snapshot = IssueSnapshot(
+            self.cache_dir / "issues.json",
+            repo=issues_config.repo,
+            full_sync_hours=issues_config.full_sync_hours
+        )
+        since = snapshot.since()
+        
+        try:
+            issues = fetch(
+                repo=issues_config.repo,
+                state="all",
+                sort=issues_config.sort,
+                since=since
+            )
+        except RateLimitExceeded as e:
+            if not snapshot.issues:
+                raise
+            logger.warning(f"{e}; using the last issue snapshot")
+            return snapshot.sorted_issues(issues_config.sort)
+        
+        if since is None:
+            snapshot.replace(issues)
+        else:
+            snapshot.merge(issues)
+        snapshot.save()
+        
+        return snapshot.sorted_issues(issues_config.sort)
+    
+    def _log_api_budget(self) -> None:
+        """Report how much of the GitHub API budget this run used."""
+        budget = self.github_service.scheduler.budget
+        remaining = ", ".join(
+            f"{name}: {limit['remaining']}/{limit['limit']}"
+            for name, limit in budget["resources"].items()
+        ) or "unknown"
+        logger.info(
+            f"GitHub API: {budget['requests']} requests "
+            f"({budget['not_modified']} not modified, {budget['retries']} retried), "
+            f"remaining {remaining}"
+        )
+    
+    def _probe_issues(self, issues: List[Dict[str, Any]]) -> None:
+        """
+        Run link, feed and avatar probes for all issues concurrently.
+        
+        Probes run on a host-limited thread pool; results are applied on the
+        calling thread in issue order so the output is identical to probing
+        sequentially.
+        """
+        network = self.config.network
+        combined = self.config.links.probe == "combined"
+        
+        with HostLimitedExecutor(network.max_workers, network.per_host_limit) as executor:
+            probes = []
+            waiting = []
+            for issue in issues:
+                futures = {}
+                # Feed and avatar probes of empty fields wait for homepage discovery
+                homepage_url = issue.get("url")
+                discoverable = combined and isinstance(homepage_url, str) and homepage_url
+                missing = self._missing_discoverable(issue) if discoverable else []
+                self._submit_content_probes(executor, issue, futures, skip=missing)
+                probes.append(futures)
+                waiting.append(missing)
+            
+            # Check link status if URL exists (matching original logic)
+            links = self.link_checker.check_many(
+                [issue["url"] for issue in issues if "url" in issue and issue["url"]],
+                executor=executor,
+                probe=self.config.links.probe,
+                discover=[issue["url"] for issue, missing in zip(issues, waiting) if missing]
+            )
+            self._log_link_summary(links)
+            
+            # Fill in feed and avatar URLs found on the homepage, then probe them
+            for issue, futures, missing in zip(issues, probes, waiting):
+                if not missing:
+                    continue
+                homepage = links.get(issue["url"], {})
+                for field in missing:
+                    discovered = homepage.get(self.DISCOVERED_FIELDS[field])
+                    if discovered:
+                        logger.info(f"Discovered {field} for {issue['url']}: {discovered}")
+                        issue[field] = discovered
+                submitted = [field for field in self.DISCOVERED_FIELDS if field not in missing]
+                self._submit_content_probes(executor, issue, futures, skip=submitted)
+            
+            for issue, futures in zip(issues, probes):
+                if "url" in issue and issue["url"]:
+                    # Any HTTP response counts as active, like the original generator
+                    link = links.get(issue["url"]) if isinstance(issue["url"], str) else None
+                    issue["status"] = "active" if link and link["reachable"] else "404"
+                if "rss" in futures:
+                    issue["rss"] = futures["rss"].result()
+                    if self.feed_slimmer and issue["rss"]:
+                        issue["rss"] = self.feed_slimmer.slim(issue["rss"])
+                if "avatar" in futures:
+                    issue.update(futures["avatar"].result())
+        
+        if self.link_health:
+            self.link_health.save()
+        if self.avatar_health:
+            self.avatar_health.save()
+        if self.rss_service.cache:
+            self.rss_service.cache.save()
+        if self.avatar_thumbnailer and self.avatar_thumbnailer.cache:
+            self.avatar_thumbnailer.cache.save()
+    
+    def _log_link_summary(self, links: Dict[str, Dict[str, Any]]) -> None:
+        """Report how many link checks were deduplicated or cached, and the slowest hosts."""
+        summary = self.link_checker.summarize(links)
+        logger.info(
+            f"Checked {len(links)} links: {summary['unique']} unique, "
+            f"{summary['cached']} from cache, {summary['requested']} requested"
+        )
+        if summary["slowest_hosts"]:
+            logger.info("Slowest hosts: " + ", ".join(
+                f"{host} ({latency} ms)" for host, latency in summary["slowest_hosts"]
+            ))
+    
+    def _submit_content_probes(
+        self,
+        executor: HostLimitedExecutor,
+        issue: Dict[str, Any],
+        futures: Dict[str, Any],
+        skip: Sequence[str] = ()
+    ) -> None:
+        """Submit the feed and avatar probes of an issue, except fields in ``skip``."""
+        # Get RSS content if feed URL exists
+        if "url-feed" not in skip and issue.get("url-feed"):
+            futures["rss"] = executor.submit(
+                issue["url-feed"], self.rss_service.get_feed_content, issue["url-feed"]
+            )
+        # Optimize avatar for better frontend loading
+        if "avatar" not in skip and "avatar" in issue:
+            futures["avatar"] = executor.submit(issue["avatar"], self._probe_avatar, issue)
+    
+    def _probe_avatar(self, issue: Dict[str, Any]) -> Dict[str, Any]:
+        """Inspect an avatar and point it at its thumbnail when one can be made."""
+        updates = self.avatar_optimizer.inspect_avatar(issue)
+        name = None
+        if self.avatar_thumbnailer and updates["avatar_status"] == "success":
+            name = self.avatar_thumbnailer.thumbnail(issue["avatar"])
+            if name:
+                self.thumbnails.add(name)
+                updates["avatar"] = self._thumbnail_url(name)
+                updates["avatar_original"] = issue["avatar"]
+        
+        avatars = self.config.output.avatars
+        if avatars.placeholders:
+            placeholder = None
+            if name:
+                placeholder = self.avatar_thumbnailer.placeholder(name, size=avatars.placeholder_size)
+            updates["avatar_placeholder"] = (
+                placeholder or self.avatar_optimizer.generate_loading_placeholder(issue.get("title", "User"))
+            )
+        return updates
+    
+    def _thumbnail_url(self, name: str) -> str:
+        """Public URL of an exported thumbnail under ``base_url``."""
+        avatars = self.config.output.avatars
+        return f"{avatars.base_url.rstrip('/')}/{avatars.dir}/{name}"
+    
+    @staticmethod
+    def _missing_discoverable(issue: Dict[str, Any]) -> List[str]:
+        """Fields that may be discovered from the homepage because they are empty."""
+        return [
+            field for field in FriendlyLinksGenerator.DISCOVERED_FIELDS
+            if not issue.get(field)
+        ]
+    
+    def _filter_issues_for_group(
+        self,
+        issues: List[Dict[str, Any]],
+        group_config,
+        index: Optional[GroupIndex] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Filter issues based on group configuration.
+        
+        Args:
+            issues: Parsed issues
+            group_config: Group to resolve
+            index: Label and state index of ``issues``, built if omitted
+        
+        Returns:
+            Issues of the group, in original order unless the group sets
+            ``sort_by``, and cut to its ``limit``
+        """
+        if index is None:
+            index = GroupIndex(issues)
+        return [issues[position] for position in self._group_positions(index, group_config)]
+    
+    @staticmethod
+    def _group_positions(index: GroupIndex, group_config) -> List[int]:
+        """Positions of the issues of a group in the indexed issue list."""
+        positions = index.select(
+            state=group_config.state,
+            labels=group_config.labels,
+            any_labels=group_config.any_labels,
+            exclude_labels=group_config.exclude_labels
+        )
+        return index.order(positions, sort_by=group_config.sort_by, limit=group_config.limit)
     
     def _remove_raw_data(self, issues: List[Dict[str, Any]]) -> None:
         """Remove raw GitHub data from all issues."""
         for issue in issues:
             issue.pop("raw", None)
     
-    def save_results(self, output: Dict[str, List[Dict[str, Any]]], output_dir: str = "json") -> None:
+    def save_results(
+        self,
+        output: Dict[str, List[Dict[str, Any]]],
+        output_dir: str = "json",
+        entry_ids: Optional[Dict[str, List[int]]] = None
+    ) -> bool:
         """
         Save results to JSON files.
         
+        Files whose content did not change are left untouched, and a
+        ``manifest.json`` with the hash of every file is written alongside.
+        
         Args:
             output: Generated friendly links data
             output_dir: Output directory
+            entry_ids: Issue numbers of the entries of each group, needed by
+                the normalized layout; defaults to those recorded by the
+                last ``process_issues`` call
+        
+        Returns:
+            Whether any output file changed
+        
+        Raises:
+            ValueError: If the normalized layout is configured and
+                ``entry_ids`` do not match the groups of ``output``
         """
         output_path = Path(output_dir)
         output_path.mkdir(exist_ok=True)
+        compact = self.config.output.profile == "compact"
+        # Pages of groups that are no longer paged, or no longer exist, are removed
+        writer = OutputWriter(output_path, minify=compact, compress=compact, managed=["*/page-*.json"])
         
-        for group_name, issues in output.items():
-            file_path = output_path / f"{group_name}.json"
-            
-            # Create output structure with metadata
-            file_content = {
-                "version": __version__,
-                "config": self.config.model_dump(),
-                "label": group_name,
-                "content": issues,
-            }
-            
-            with open(file_path, "w", encoding="utf-8") as file:
-                json.dump(file_content, file, ensure_ascii=False, indent=4)
-            
-            logger.info(f"Generated file: {file_path}")
+        groups = output
+        if self.config.output.layout == "normalized":
+            # Every entry is written once; groups list issue numbers in order
+            if entry_ids is None:
+                entry_ids = self.entry_ids
+            if any(len(entry_ids.get(group_name, ())) != len(issues) for group_name, issues in output.items()):
+                raise ValueError("The normalized layout needs the issue numbers of every group")
+            entries = {str(number): issue for number, issue in zip(entry_ids["all"], output["all"])}
+            self._save_group(writer, output_path, self.config.output.entries, entries, with_config=False)
+            groups = {group_name: entry_ids[group_name] for group_name in output}
+        
+        for group_name, content in groups.items():
+            self._save_group(writer, output_path, group_name, content)
+        
+        if self.config.output.timeline.enabled:
+            self._save_timeline(output, output_path, writer)
+        if self.avatar_thumbnailer:
+            self._export_thumbnails(output_path, writer)
         
+        # The compact profile keeps the shared metadata in the manifest only
+        metadata = {"version": __version__}
+        if compact:
+            metadata["config"] = self.config.model_dump()
+        changed = writer.finish(**metadata)
         logger.info("All files generated successfully")
+        return changed
+    
+    def _save_group(
+        self,
+        writer: OutputWriter,
+        output_path: Path,
+        label: str,
+        content: Any,
+        with_config: bool = True
+    ) -> None:
+        """
+        Write one output file with its metadata.
+        
+        With ``output.page_size`` set, list content is split into pages and
+        the file becomes an index of those pages instead.
+        """
+        file_path = output_path / f"{label}.json"
+        
+        # Create output structure with metadata
+        file_content = {
+            **self._file_metadata(with_config=with_config),
+            "label": label,
+        }
+        if self.config.output.page_size > 0 and isinstance(content, list):
+            file_content.update(self._save_pages(writer, label, content))
+        else:
+            file_content["content"] = content
+        
+        if writer.write_json(file_path.name, file_content):
+            logger.info(f"Generated file: {file_path}")
+        else:
+            logger.info(f"Unchanged file: {file_path}")
+    
+    def _save_pages(
+        self,
+        writer: OutputWriter,
+        label: str,
+        content: List[Any]
+    ) -> Dict[str, Any]:
+        """
+        Write list content as ``<label>/page-<n>.json`` files.
+        
+        Pages left over from a previous build are removed by the writer.
+        
+        Returns:
+            Index fields: totals and the file, size and hash of every page
+        """
+        page_size = self.config.output.page_size
+        pages = []
+        for start in range(0, len(content), page_size):
+            name = f"{label}/page-{len(pages) + 1}.json"
+            page = content[start:start + page_size]
+            writer.write_json(name, {
+                **self._file_metadata(),
+                "label": label,
+                "page": len(pages) + 1,
+                "content": page,
+            })
+            pages.append({"file": name, "count": len(page), "sha256": writer.files[name]["sha256"]})
+        
+        logger.info(f"Split '{label}' into {len(pages)} pages")
+        return {"total": len(content), "page_size": page_size, "pages": pages}
+    
+    def _file_metadata(self, with_config: bool = False) -> Dict[str, Any]:
+        """Metadata repeated at the top of every file by the ``pretty`` output profile."""
+        if self.config.output.profile == "compact":
+            return {}
+        
+        metadata = {"version": __version__}
+        if with_config:
+            metadata["config"] = self.config.model_dump()
+        return metadata
+    
+    def _save_timeline(
+        self,
+        output: Dict[str, List[Dict[str, Any]]],
+        output_path: Path,
+        writer: OutputWriter
+    ) -> None:
+        """
+        Save the latest posts of all friends as one timeline file.
+        
+        The previous timeline file is merged in, so the timeline is updated
+        incrementally rather than rebuilt from the current feed windows only.
+        """
+        timeline_config = self.config.output.timeline
+        if timeline_config.group not in output:
+            logger.warning(f"Timeline group '{timeline_config.group}' does not exist, skipping timeline")
+            return
+        
+        file_path = output_path / f"{timeline_config.name}.json"
+        previous = load_json(file_path, default={}).get("content", [])
+        
+        posts = TimelineBuilder(limit=timeline_config.limit).build(
+            output[timeline_config.group],
+            previous=previous
+        )
+        
+        file_content = {
+            **self._file_metadata(),
+            "label": timeline_config.name,
+            "content": posts,
+        }
+        
+        writer.write_json(file_path.name, file_content)
+        logger.info(f"Generated timeline: {file_path} ({len(posts)} posts)")
+    
+    def _export_thumbnails(self, output_path: Path, writer: OutputWriter) -> None:
+        """
+        Write the thumbnails used by this build next to the JSON files.
+        
+        Sprite sheets are written alongside when enabled. Thumbnails and
+        sheets no longer referenced are removed from the output and the
+        store, so neither grows with every changed avatar.
+        """
+        avatar_dir = self.config.output.avatars.dir
+        target = output_path / avatar_dir
+        target.mkdir(exist_ok=True)
+        
+        for name in sorted(self.thumbnails):
+            # Images are already compressed, precompressed siblings would not help
+            writer.write_bytes(f"{avatar_dir}/{name}", self.avatar_thumbnailer.path(name).read_bytes(), compress=False)
+        
+        sheets = self._save_sprites(output_path, target, writer) if self.config.output.avatars.sprites else []
+        keep = self.thumbnails.union(sheets)
+        stale = [path for path in target.iterdir() if path.is_file() and path.name not in keep]
+        for path in stale:
+            path.unlink()
+        self.avatar_thumbnailer.prune(keep=self.thumbnails)
+        
+        logger.info(f"Exported {len(self.thumbnails)} avatar thumbnails to {target}, removed {len(stale)}")
+    
+    def _save_sprites(self, output_path: Path, target: Path, writer: OutputWriter) -> List[str]:
+        """
+        Pack the exported thumbnails into sprite sheets.
+        
+        The offsets manifest maps each ``avatar`` URL to its sheet and pixel
+        offset, and is written as ``avatar_sprites.json``.
+        
+        Returns:
+            File names of the sheets
+        """
+        avatars = self.config.output.avatars
+        builder = AvatarSpriteBuilder(
+            size=avatars.size,
+            columns=avatars.sprite_columns,
+            per_sheet=avatars.sprite_per_sheet,
+            image_format=avatars.format,
+            quality=avatars.quality
+        )
+        sheets, positions = builder.build({name: target / name for name in self.thumbnails})
+        
+        for name, data in sheets.items():
+            writer.write_bytes(f"{avatars.dir}/{name}", data, compress=False)
+        
+        file_content = {
+            **self._file_metadata(),
+            "size": avatars.size,
+            "sheets": [self._thumbnail_url(name) for name in sheets],
+            "avatars": {self._thumbnail_url(name): position for name, position in sorted(positions.items())},
+        }
+        file_path = output_path / "avatar_sprites.json"
+        writer.write_json(file_path.name, file_content)
+        
+        logger.info(f"Generated {len(sheets)} avatar sprite sheets for {len(positions)} avatars: {file_path}")
+        return list(sheets)
 
 
 def main() -> None:
@@ -182,10 +683,16 @@ def main() -> None:
     try:
         generator = FriendlyLinksGenerator()
         output = generator.process_issues()
-        generator.save_results(output)
+        changed = generator.save_results(output)
         
-        logger.info("Friendly links generation completed successfully")
+        # Let the workflow skip committing a build that changed nothing
+        github_output = os.getenv("GITHUB_OUTPUT")
+        if github_output:
+            with open(github_output, "a", encoding="utf-8") as file:
+                file.write(f"changed={'true' if changed else 'false'}\n")
         
+        logger.info("Friendly links generation completed successfully")
+    
     except Exception as e:
         logger.error(f"Generation failed: {e}")
         raise
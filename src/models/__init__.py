@@ -1,5 +1,29 @@
 """Data models for the friendly links generator."""
 
-from .config import Config, GroupConfig, IssuesConfig
+from .config import (
+    AvatarsConfig,
+    CacheConfig,
+    Config,
+    FeedsConfig,
+    GroupConfig,
+    IssuesConfig,
+    LinksConfig,
+    NetworkConfig,
+    OutputConfig,
+    SlimConfig,
+    TimelineConfig,
+)
 
-__all__ = ["Config", "GroupConfig", "IssuesConfig"] 
\ No newline at end of file
+__all__ = [
+    "AvatarsConfig",
+    "CacheConfig",
+    "Config",
+    "FeedsConfig",
+    "GroupConfig",
+    "IssuesConfig",
+    "LinksConfig",
+    "NetworkConfig",
+    "OutputConfig",
+    "SlimConfig",
+    "TimelineConfig",
+]
@@ -1,7 +1,7 @@
 """Configuration data models with validation."""
 
 from typing import List, Optional
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel, field_validator, model_validator
 
 
 class GroupConfig(BaseModel):
@@ -10,6 +10,10 @@ class GroupConfig(BaseModel):
     name: str
     state: str = "all"
     labels: List[str] = []
+    any_labels: List[str] = []
+    exclude_labels: List[str] = []
+    sort_by: Optional[str] = None
+    limit: int = 0
     
     @field_validator('state')
     @classmethod
@@ -18,6 +22,16 @@ class GroupConfig(BaseModel):
         if v not in valid_states:
             raise ValueError(f"State must be one of {valid_states}")
         return v
+    
+    @field_validator('sort_by')
+    @classmethod
+    def validate_sort_by(cls, v: Optional[str]) -> Optional[str]:
+        if v is None:
+            return v
+        # Imported here: the utils package loads the config models itself
+        from ..utils.group_index import parse_group_sort
+        parse_group_sort(v)
+        return v
 
 
 class IssuesConfig(BaseModel):
@@ -27,6 +41,12 @@ class IssuesConfig(BaseModel):
     groups: List[GroupConfig] = []
     sort: str = "created"
     keep_raw: bool = False
+    incremental: bool = False
+    parse_cache: bool = True
+    full_sync_hours: int = 24
+    page_workers: int = 4
+    backend: str = "rest"
+    rate_limit_wait: int = 60
     
     @field_validator('repo')
     @classmethod
@@ -42,9 +62,155 @@ class IssuesConfig(BaseModel):
         if v not in valid_sorts:
             raise ValueError(f"Sort must be one of {valid_sorts}")
         return v
+    
+    @field_validator('backend')
+    @classmethod
+    def validate_backend(cls, v: str) -> str:
+        valid_backends = {"rest", "graphql"}
+        if v not in valid_backends:
+            raise ValueError(f"Backend must be one of {valid_backends}")
+        return v
+
+
+class NetworkConfig(BaseModel):
+    """Configuration for outbound HTTP requests and concurrent probing."""
+    
+    max_workers: int = 16
+    per_host_limit: int = 4
+    pool_size: int = 10
+    retries: int = 1
+    backoff_factor: float = 0.5
+    
+    @field_validator('max_workers', 'per_host_limit', 'pool_size')
+    @classmethod
+    def validate_positive(cls, v: int) -> int:
+        if v < 1:
+            raise ValueError("Concurrency limits must be at least 1")
+        return v
+
+
+class LinksConfig(BaseModel):
+    """Configuration for friend link status checks."""
+    
+    health_cache: bool = True
+    ttl: int = 6 * 3600
+    max_ttl: int = 48 * 3600
+    retry_interval: int = 3600
+    probe: str = "head"
+    probe_max_bytes: int = 64 * 1024
+    
+    @field_validator('probe')
+    @classmethod
+    def validate_probe(cls, v: str) -> str:
+        valid_probes = {"head", "combined"}
+        if v not in valid_probes:
+            raise ValueError(f"Probe must be one of {valid_probes}")
+        return v
+
+
+class SlimConfig(BaseModel):
+    """Configuration for trimming feed entries before they are written."""
+    
+    enabled: bool = False
+    strip_html: bool = True
+    summary_length: int = 200
+    iso_dates: bool = True
+    drop_fields: List[str] = ["published_parsed"]
+    drop_empty: bool = True
+    dedupe: bool = True
+
+
+class FeedsConfig(BaseModel):
+    """Configuration for fetching friends' RSS feeds."""
+    
+    conditional: bool = True
+    streaming: bool = False
+    max_bytes: int = 1024 * 1024
+    timeout: int = 10
+    slim: SlimConfig = SlimConfig()
+
+
+class TimelineConfig(BaseModel):
+    """Configuration for the global latest posts timeline."""
+    
+    enabled: bool = False
+    name: str = "timeline"
+    group: str = "all"
+    limit: int = 50
+
+
+class AvatarsConfig(BaseModel):
+    """Configuration for avatar thumbnails stored next to the JSON files."""
+    
+    thumbnails: bool = False
+    dir: str = "avatars"
+    base_url: str = ""
+    size: int = 96
+    format: str = "webp"
+    quality: int = 80
+    max_bytes: int = 2 * 1024 * 1024
+    sprites: bool = False
+    sprite_columns: int = 16
+    sprite_per_sheet: int = 256
+    placeholders: bool = False
+    placeholder_size: int = 8
+    
+    @field_validator('format')
+    @classmethod
+    def validate_format(cls, v: str) -> str:
+        valid_formats = {"webp", "png", "jpeg"}
+        if v not in valid_formats:
+            raise ValueError(f"Avatar format must be one of {valid_formats}")
+        return v
+    
+    @model_validator(mode='after')
+    def validate_base_url(self) -> "AvatarsConfig":
+        # Relative thumbnail paths would resolve against the blog page, not the JSON file
+        if self.thumbnails and not self.base_url.strip():
+            raise ValueError("Avatar thumbnails require output.avatars.base_url, the public URL of the output directory")
+        return self
+
+
+class OutputConfig(BaseModel):
+    """Configuration for generated files."""
+    
+    profile: str = "pretty"
+    layout: str = "inline"
+    entries: str = "entries"
+    page_size: int = 0
+    timeline: TimelineConfig = TimelineConfig()
+    avatars: AvatarsConfig = AvatarsConfig()
+    
+    @field_validator('profile')
+    @classmethod
+    def validate_profile(cls, v: str) -> str:
+        valid_profiles = {"pretty", "compact"}
+        if v not in valid_profiles:
+            raise ValueError(f"Output profile must be one of {valid_profiles}")
+        return v
+    
+    @field_validator('layout')
+    @classmethod
+    def validate_layout(cls, v: str) -> str:
+        valid_layouts = {"inline", "normalized"}
+        if v not in valid_layouts:
+            raise ValueError(f"Output layout must be one of {valid_layouts}")
+        return v
+
+
+class CacheConfig(BaseModel):
+    """Configuration for data persisted between runs."""
+    
+    enabled: bool = True
+    dir: str = ".cache"
 
 
 class Config(BaseModel):
     """Main configuration model."""
     
-    issues: IssuesConfig 
\ No newline at end of file
+    issues: IssuesConfig
+    network: NetworkConfig = NetworkConfig()
+    cache: CacheConfig = CacheConfig()
+    links: LinksConfig = LinksConfig()
+    feeds: FeedsConfig = FeedsConfig()
+    output: OutputConfig = OutputConfig() 
\ No newline at end of file
@@ -1,6 +1,9 @@
 """Parsers for different issue body formats."""
 
+from .scanner import BodyScan
 from .json_parser import JsonParser
 from .table_parser import TableParser
+from .registry import ParserRegistry
+from .cache import ParseCache
 
-__all__ = ["JsonParser", "TableParser"] 
\ No newline at end of file
+__all__ = ["BodyScan", "JsonParser", "TableParser", "ParserRegistry", "ParseCache"] 
\ No newline at end of file
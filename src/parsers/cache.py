@@ -0,0 +1,95 @@
+"""Parse results persisted between runs."""
+
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+import logging
+
+from ..utils.json_store import load_json, dump_json_atomic
+
+logger = logging.getLogger(__name__)
+
+
+class ParseCache:
+    """
+    Fields extracted from issue bodies, keyed by issue number.
+    
+    An entry is reused while the issue's ``updated_at`` is unchanged, since
+    GitHub bumps it on every edit of the body. All entries are dropped when
+    the parser version changes, so fixes to the parsers apply to every
+    issue on the next run. Entries hold the parsed fields without ``raw``;
+    the current issue is attached again on a hit.
+    """
+    
+    def __init__(self, path: Union[str, Path], version: str):
+        """
+        Initialize the cache.
+        
+        Args:
+            path: JSON file backing the cache
+            version: Version of the parsing code, see ``ParserRegistry.version``
+        """
+        self.path = Path(path)
+        self.version = version
+        
+        data = load_json(self.path, default={})
+        if data.get("version") != version:
+            if data:
+                logger.info("Parser code changed, discarding cached parse results")
+            data = {}
+        
+        self._entries: Dict[str, Dict[str, Any]] = data.get("entries", {})
+        self._seen = set()
+        self._dirty = False
+        self.hits = 0
+    
+    def get(self, issue_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Return the cached parse result of an unchanged issue.
+        
+        Args:
+            issue_data: GitHub issue data
+        
+        Returns:
+            A new result dict with ``raw`` set to ``issue_data``, ``{}`` if the
+            issue could not be parsed last time, or None on a miss
+        """
+        key = str(issue_data.get("number"))
+        self._seen.add(key)
+        entry = self._entries.get(key)
+        updated_at = issue_data.get("updated_at")
+        if not (entry and updated_at) or entry.get("updated_at") != updated_at:
+            return None
+        
+        self.hits += 1
+        fields = entry.get("fields")
+        if fields is None:
+            return {}
+        return dict(fields, raw=issue_data)
+    
+    def put(self, issue_data: Dict[str, Any], result: Optional[Dict[str, Any]]) -> None:
+        """
+        Store the parse result of an issue.
+        
+        Args:
+            issue_data: GitHub issue data
+            result: Parsed friendly link data, or None if no parser succeeded
+        """
+        key = str(issue_data.get("number"))
+        self._seen.add(key)
+        fields = None
+        if result:
+            fields = {name: value for name, value in result.items() if name != "raw"}
+        self._entries[key] = {"updated_at": issue_data.get("updated_at"), "fields": fields}
+        self._dirty = True
+    
+    def save(self) -> None:
+        """Persist the cache, dropping issues that were not parsed this run."""
+        stale = set(self._entries) - self._seen
+        if not (self._dirty or stale):
+            return
+        
+        for key in stale:
+            del self._entries[key]
+        dump_json_atomic(self.path, {"version": self.version, "entries": self._entries})
+        self._dirty = False
+        logger.debug(f"Saved {len(self._entries)} parse results to {self.path}")
@@ -1,42 +1,49 @@
 """Parser for JSON format in issue body."""
 
 import json
-import re
 from typing import Dict, Any, Optional
 import logging
 
+from .scanner import BodyScan
+
 logger = logging.getLogger(__name__)
 
 
 class JsonParser:
     """Parser for extracting JSON data from issue body."""
     
+    @staticmethod
+    def detect(scan: BodyScan) -> bool:
+        """Check if a scanned body contains JSON format."""
+        return scan.json_block is not None
+    
     @staticmethod
     def can_parse(body: str) -> bool:
         """Check if the body contains JSON format."""
-        return bool(re.findall(r"```json([\s\S]+?)```", body))
+        return JsonParser.detect(BodyScan(body))
     
     @staticmethod
-    def parse(issue_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    def parse(issue_data: Dict[str, Any], scan: Optional[BodyScan] = None) -> Optional[Dict[str, Any]]:
         """
         Parse JSON format from issue body.
         
         Args:
             issue_data: GitHub issue data
+            scan: Scan of the issue body, if already done
             
         Returns:
             Parsed friendly link data or None if parsing fails
         """
         try:
-            body = issue_data.get("body", "")
-            json_matches = re.findall(r"```json([\s\S]+?)```", body)
+            if scan is None:
+                scan = BodyScan(issue_data.get("body", ""))
             
-            if not json_matches:
+            if scan.json_block is None:
                 logger.warning(f"No JSON block found in issue #{issue_data.get('number')}")
                 return None
             
             # Parse the first JSON block found
-            json_str = json_matches[0].strip()
+            json_str = scan.json_block.strip()
             if not json_str:
                 logger.warning(f"Empty JSON block in issue #{issue_data.get('number')}")
                 return None
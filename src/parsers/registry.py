@@ -0,0 +1,64 @@
+"""Ordered parser registry sharing one scan per issue body."""
+
+import hashlib
+import sys
+from pathlib import Path
+from typing import Any, Dict, Optional, Sequence
+import logging
+
+from .json_parser import JsonParser
+from .scanner import BodyScan
+from .table_parser import TableParser
+
+logger = logging.getLogger(__name__)
+
+
+class ParserRegistry:
+    """Try parsers in order on a single scan of each issue body."""
+    
+    def __init__(self, parsers: Sequence[Any] = (JsonParser, TableParser)):
+        """
+        Initialize the registry.
+        
+        Args:
+            parsers: Parser classes providing ``detect(scan)`` and
+                ``parse(issue_data, scan)``, in order of precedence
+        """
+        self.parsers = list(parsers)
+        self._version: Optional[str] = None
+    
+    @property
+    def version(self) -> str:
+        """
+        Hash of the source of the registered parsers and the shared scanner.
+        
+        Any edit to the parsing code changes the version, which invalidates
+        parse results cached by earlier runs.
+        """
+        if self._version is None:
+            modules = [parser_class.__module__ for parser_class in self.parsers]
+            modules += [BodyScan.__module__, __name__]
+            digest = hashlib.sha256()
+            for module in modules:
+                digest.update(module.encode("utf-8"))
+                digest.update(Path(sys.modules[module].__file__).read_bytes())
+            self._version = digest.hexdigest()[:16]
+        return self._version
+    
+    def parse(self, issue_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Parse an issue with the first parser that detects and parses it.
+        
+        Args:
+            issue_data: GitHub issue data
+        
+        Returns:
+            Parsed friendly link data, or None if no parser succeeded
+        """
+        scan = BodyScan(issue_data.get("body", ""))
+        for parser_class in self.parsers:
+            if parser_class.detect(scan):
+                result = parser_class.parse(issue_data, scan)
+                if result:
+                    return result
+        return None
@@ -0,0 +1,42 @@
+"""Single-pass scanner for issue bodies."""
+
+from typing import Optional
+
+JSON_FENCE = "```json"
+FENCE = "```"
+HEADING = "###"
+
+
+class BodyScan:
+    """
+    Locations of JSON blocks and section headings in an issue body.
+    
+    The body is scanned once, and the result is shared by parser detection
+    and extraction. The JSON block is the one the former
+    ``re.findall(r"```json([\s\S]+?)```")`` found first, located with two
+    ``str.find`` calls instead of a regex.
+    """
+    
+    __slots__ = ("body", "json_block")
+    
+    def __init__(self, body: Optional[str]):
+        """
+        Scan a body.
+        
+        Args:
+            body: Issue body (None is treated as empty)
+        """
+        self.body = body or ""
+        self.json_block: Optional[str] = None
+        
+        start = self.body.find(JSON_FENCE)
+        if start != -1:
+            # The block needs at least one character before the closing fence
+            end = self.body.find(FENCE, start + len(JSON_FENCE) + 1)
+            if end != -1:
+                self.json_block = self.body[start + len(JSON_FENCE):end]
+    
+    @property
+    def has_sections(self) -> bool:
+        """Whether the body contains a ``###`` heading."""
+        return HEADING in self.body
@@ -3,6 +3,8 @@
 from typing import Dict, Any, Optional
 import logging
 
+from .scanner import HEADING, BodyScan
+
 logger = logging.getLogger(__name__)
 
 
@@ -19,58 +21,56 @@ class TableParser:
         "url-feed": "订阅地址",
     }
     
+    @staticmethod
+    def detect(scan: BodyScan) -> bool:
+        """Check if a scanned body contains table format (has ### sections)."""
+        return scan.has_sections
+    
     @staticmethod
     def can_parse(body: str) -> bool:
         """Check if the body contains table format (has ### sections)."""
         return "###" in body
     
     @staticmethod
-    def parse(issue_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    def parse(issue_data: Dict[str, Any], scan: Optional[BodyScan] = None) -> Optional[Dict[str, Any]]:
         """
         Parse table format from issue body.
         
+        Line endings are normalized once for the whole body, and each section
+        is cut at its first two blank lines with ``str.partition`` instead of
+        being split into all of its paragraphs.
+        
         Args:
             issue_data: GitHub issue data
+            scan: Scan of the issue body, if already done
             
         Returns:
             Parsed friendly link data or None if parsing fails
         """
         try:
-            body = issue_data.get("body", "").strip()
+            if scan is None:
+                scan = BodyScan(issue_data.get("body", ""))
             
-            # Split by ### to get sections
-            sections = body.split("###")
+            # Sections are "### title", a blank line, then the value
             raw_data = {}
-            
-            for section in sections:
-                if not section.strip():
-                    continue
-                    
-                # Replace Windows line endings
-                section = section.replace("\r\n", "\n")
-                
-                # Split by double newline to separate title and value
-                parts = section.split("\n\n")
-                if len(parts) < 2:
-                    continue
-                    
-                key = parts[0].strip()
-                value = parts[1].strip()
-                raw_data[key] = value
+            for section in scan.body.replace("\r\n", "\n").strip().split(HEADING):
+                key, separator, rest = section.partition("\n\n")
+                if separator:
+                    raw_data[key.strip()] = rest.partition("\n\n")[0].strip()
             
             # Map Chinese field names to English keys
             result = {}
             for eng_key, chi_key in TableParser.FIELD_MAPPING.items():
-                value = raw_data.get(chi_key, "").strip()
+                value = raw_data.get(chi_key, "")
                 # Handle GitHub's "_No response_" placeholder
                 result[eng_key] = "" if value == "_No response_" else value
             
             # Add the raw issue data
-            result = dict(result, **{"raw": issue_data})
+            result["raw"] = issue_data
             
             logger.debug(f"Successfully parsed table from issue #{issue_data.get('number')}")
             return result
             
         except Exception as e:
             logger.error(f"Error parsing table from issue #{issue_data.get('number')}: {e}")
-            return None 
\ No newline at end of file
+            return None
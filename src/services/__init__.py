@@ -4,5 +4,21 @@ from .github_service import GitHubService
 from .link_checker import LinkChecker
 from .rss_service import RSSService
 from .avatar_optimizer import AvatarOptimizer
+from .avatar_thumbnails import AvatarThumbnailer
+from .avatar_sprites import AvatarSpriteBuilder
+from .rate_limiter import RateLimitExceeded, RateLimitScheduler
+from .timeline import TimelineBuilder
+from .feed_slimmer import FeedSlimmer
 
-__all__ = ["GitHubService", "LinkChecker", "RSSService", "AvatarOptimizer"] 
\ No newline at end of file
+__all__ = [
+    "GitHubService",
+    "LinkChecker",
+    "RSSService",
+    "AvatarOptimizer",
+    "AvatarThumbnailer",
+    "AvatarSpriteBuilder",
+    "RateLimitExceeded",
+    "RateLimitScheduler",
+    "TimelineBuilder",
+    "FeedSlimmer",
+] 
\ No newline at end of file
@@ -9,20 +9,37 @@ from urllib.parse import urlparse
 import base64
 import io
 
+from ..utils.link_health import LinkHealthStore
+
 logger = logging.getLogger(__name__)
 
 
 class AvatarOptimizer:
-    """Service for optimizing avatar loading experience."""
+    """
+    Service for optimizing avatar loading experience.
+    
+    With a health store, avatars are only re-measured when their record is
+    due, so network jitter in the load time does not change the generated
+    files on every run.
+    """
     
-    def __init__(self, timeout: int = 5):
+    def __init__(
+        self,
+        timeout: int = 5,
+        session: Optional[requests.Session] = None,
+        health_store: Optional[LinkHealthStore] = None
+    ):
         """
         Initialize avatar optimizer.
         
         Args:
             timeout: Request timeout in seconds
+            session: Shared HTTP session (a new one is created if omitted)
+            health_store: Store of previous avatar checks to reuse while fresh
         """
         self.timeout = timeout
+        self.session = session or requests.Session()
+        self.health_store = health_store
         self.default_avatars = [
             "https://ui-avatars.com/api/?name={name}&background=6366f1&color=fff&size=128",
             "https://api.dicebear.com/7.x/avataaars/svg?seed={name}",
@@ -39,29 +56,62 @@ class AvatarOptimizer:
         Returns:
             Optimized data with avatar loading information
         """
+        issue_data.update(self.inspect_avatar(issue_data))
+        return issue_data
+    
+    def inspect_avatar(self, issue_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Probe the avatar without modifying the friend link data.
+        
+        Safe to call from worker threads; the caller applies the returned
+        fields with ``dict.update`` so field order stays the same as
+        ``optimize_avatar``.
+        
+        Args:
+            issue_data: Friend link data
+            
+        Returns:
+            Avatar fields to merge into the friend link data
+        """
         original_avatar = issue_data.get("avatar", "")
         title = issue_data.get("title", "User")
         
         # Test original avatar
-        avatar_status = self._test_avatar_url(original_avatar)
+        avatar_status = self._check_avatar_url(original_avatar)
         
         # Generate fallback avatars
         fallback_avatars = self._generate_fallback_avatars(title)
         
         # Add optimization data
-        issue_data.update({
+        updates = {
             "avatar_status": avatar_status["status"],
             "avatar_load_time": avatar_status.get("load_time", 0),
             "avatar_fallbacks": fallback_avatars,
             "avatar_optimized": True
-        })
+        }
         
         # If original avatar failed, use first fallback as primary
         if avatar_status["status"] != "success" and fallback_avatars:
-            issue_data["avatar"] = fallback_avatars[0]
+            updates["avatar"] = fallback_avatars[0]
             logger.info(f"Using fallback avatar for {title}: {fallback_avatars[0]}")
         
-        return issue_data
+        return updates
+    
+    def _check_avatar_url(self, url: str) -> Dict[str, Any]:
+        """Test an avatar URL, reusing its health record while it is fresh."""
+        if not self.health_store or not url or not url.strip():
+            return self._test_avatar_url(url)
+        
+        record = self.health_store.get_fresh(url)
+        if record and "avatar" in record:
+            logger.debug(f"Using cached avatar status for {url}: {record['status']}")
+            return record["avatar"]
+        
+        result = self._test_avatar_url(url)
+        self.health_store.record(
+            url, result["status"], result.get("load_time", 0), healthy=result["status"] == "success", avatar=result
+        )
+        return result
     
     def _test_avatar_url(self, url: str) -> Dict[str, Any]:
         """Test avatar URL accessibility and performance."""
@@ -72,7 +122,7 @@ class AvatarOptimizer:
             import time
             start_time = time.time()
             
-            response = requests.head(
+            response = self.session.head(
                 url.strip(),
                 timeout=self.timeout,
                 allow_redirects=True,
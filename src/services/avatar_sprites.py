@@ -0,0 +1,111 @@
+"""
+Avatar sprite sheets packed from stored thumbnails.
+"""
+
+import hashlib
+import io
+from pathlib import Path
+from typing import Dict, Mapping, Tuple
+import logging
+
+try:
+    from PIL import Image
+except ImportError:  # Pillow is optional; sprites are skipped without it
+    Image = None
+
+logger = logging.getLogger(__name__)
+
+
+class AvatarSpriteBuilder:
+    """
+    Pack square thumbnails into grid sprite sheets.
+    
+    Images are placed in key order, so the same set of thumbnails always
+    produces the same sheets and the sheet names, which are content hashes,
+    only change when an avatar does.
+    """
+    
+    EXTENSIONS = {"webp": "webp", "png": "png", "jpeg": "jpg"}
+    
+    def __init__(
+        self,
+        size: int = 96,
+        columns: int = 16,
+        per_sheet: int = 256,
+        image_format: str = "webp",
+        quality: int = 80
+    ):
+        """
+        Initialize the sprite builder.
+        
+        Args:
+            size: Width and height of each cell in pixels
+            columns: Cells per sheet row
+            per_sheet: Maximum number of cells per sheet
+            image_format: Sheet format, one of ``EXTENSIONS``
+            quality: Encoder quality for lossy formats
+        """
+        self.size = size
+        self.columns = columns
+        self.per_sheet = per_sheet
+        self.image_format = image_format
+        self.quality = quality
+    
+    @property
+    def available(self) -> bool:
+        """Whether Pillow is installed."""
+        return Image is not None
+    
+    def build(self, images: Mapping[str, Path]) -> Tuple[Dict[str, bytes], Dict[str, Dict[str, int]]]:
+        """
+        Pack images into sprite sheets.
+        
+        Args:
+            images: Image files by key
+        
+        Returns:
+            Encoded sheets by file name, and the sheet index and pixel
+            offset of every packed key
+        """
+        keys = sorted(images)
+        sheets: Dict[str, bytes] = {}
+        positions: Dict[str, Dict[str, int]] = {}
+        
+        for start in range(0, len(keys), self.per_sheet):
+            chunk = keys[start:start + self.per_sheet]
+            columns = min(self.columns, len(chunk))
+            rows = -(-len(chunk) // columns)
+            sheet = Image.new("RGBA", (columns * self.size, rows * self.size), (0, 0, 0, 0))
+            
+            packed = {}
+            for index, key in enumerate(chunk):
+                x = index % columns * self.size
+                y = index // columns * self.size
+                try:
+                    with Image.open(images[key]) as image:
+                        cell = image.convert("RGBA")
+                        if cell.size != (self.size, self.size):
+                            cell = cell.resize((self.size, self.size), Image.LANCZOS)
+                        sheet.paste(cell, (x, y))
+                except OSError as e:
+                    logger.warning(f"Could not add {images[key]} to the avatar sprite: {e}")
+                    continue
+                packed[key] = {"x": x, "y": y}
+            
+            data = self._encode(sheet)
+            name = self._sheet_name(data)
+            for key, offset in packed.items():
+                positions[key] = {"sheet": len(sheets), **offset}
+            sheets[name] = data
+        
+        return sheets, positions
+    
+    def _encode(self, sheet) -> bytes:
+        if self.image_format == "jpeg":
+            sheet = sheet.convert("RGB")
+        output = io.BytesIO()
+        sheet.save(output, format=self.image_format.upper(), quality=self.quality)
+        return output.getvalue()
+    
+    def _sheet_name(self, data: bytes) -> str:
+        return f"sprite-{hashlib.sha256(data).hexdigest()[:16]}.{self.EXTENSIONS[self.image_format]}"
@@ -0,0 +1,190 @@
+"""
+Avatar thumbnails stored by content hash.
+"""
+
+import base64
+import hashlib
+import io
+from pathlib import Path
+from typing import Iterable, Optional, Union
+import logging
+
+import requests
+
+from ..utils.atomic_file import write_atomic
+from ..utils.http_cache import HttpCache
+from ..utils.http_client import read_bounded
+
+try:
+    from PIL import Image, ImageFilter, ImageOps
+except ImportError:  # Pillow is optional; thumbnails are skipped without it
+    Image = None
+    ImageFilter = None
+    ImageOps = None
+
+logger = logging.getLogger(__name__)
+
+
+class AvatarThumbnailer:
+    """
+    Download avatars, resize them to square thumbnails and store them by hash.
+    
+    Thumbnails are named after the hash of their encoded bytes, so the same
+    image is stored once and a changed image gets a new name. The ETag of the
+    source and the hash of its bytes are cached per URL, so an unchanged
+    avatar is neither downloaded again (``304``) nor re-encoded.
+    """
+    
+    EXTENSIONS = {"webp": "webp", "png": "png", "jpeg": "jpg"}
+    
+    def __init__(
+        self,
+        store_dir: Union[str, Path],
+        cache: Optional[HttpCache] = None,
+        session: Optional[requests.Session] = None,
+        size: int = 96,
+        image_format: str = "webp",
+        quality: int = 80,
+        max_bytes: int = 2 * 1024 * 1024,
+        timeout: int = 10
+    ):
+        """
+        Initialize the thumbnailer.
+        
+        Args:
+            store_dir: Directory of the content-addressed thumbnail store
+            cache: Validators and source hashes of previous downloads
+            session: Shared HTTP session (a new one is created if omitted)
+            size: Width and height of the thumbnails in pixels
+            image_format: Output format, one of ``EXTENSIONS``
+            quality: Encoder quality for lossy formats
+            max_bytes: Largest source image that is downloaded
+            timeout: Download time budget in seconds
+        """
+        self.store_dir = Path(store_dir)
+        self.cache = cache
+        self.session = session or requests.Session()
+        self.size = size
+        self.image_format = image_format
+        self.quality = quality
+        self.max_bytes = max_bytes
+        self.timeout = timeout
+    
+    @property
+    def available(self) -> bool:
+        """Whether Pillow is installed."""
+        return Image is not None
+    
+    def path(self, name: str) -> Path:
+        """Path of a stored thumbnail."""
+        return self.store_dir / name
+    
+    def thumbnail(self, url: str) -> Optional[str]:
+        """
+        Return the stored thumbnail name for an avatar URL.
+        
+        Args:
+            url: Avatar image URL
+        
+        Returns:
+            File name inside the store, or None if the avatar could not be
+            downloaded or decoded
+        """
+        if not self.available or not url:
+            return None
+        
+        key = HttpCache.key(url)
+        entry = self.cache.get(key) if self.cache else None
+        if entry and not self.path(entry["body"]["file"]).exists():
+            entry = None
+        
+        try:
+            with self.session.get(
+                url,
+                headers=HttpCache.conditional_headers(entry),
+                timeout=self.timeout,
+                stream=True
+            ) as response:
+                if response.status_code == 304 and entry:
+                    return entry["body"]["file"]
+                if response.status_code != 200:
+                    logger.debug(f"Avatar download failed with HTTP {response.status_code}: {url}")
+                    return None
+                
+                content, complete = read_bounded(response, self.max_bytes, self.timeout)
+                if not complete:
+                    logger.warning(f"Avatar exceeds {self.max_bytes} bytes or the download time, not thumbnailing: {url}")
+                    return None
+                headers = response.headers
+            
+            source = hashlib.sha256(content).hexdigest()
+            if entry and entry["body"].get("source") == source:
+                name = entry["body"]["file"]
+            else:
+                name = self._store(self._encode(content))
+        except Exception as e:
+            logger.warning(f"Could not create avatar thumbnail for {url}: {e}")
+            return None
+        
+        if self.cache:
+            self.cache.store(key, headers, {"source": source, "file": name}, require_validators=False)
+        return name
+    
+    def placeholder(self, name: str, size: int = 8) -> Optional[str]:
+        """
+        Build a tiny blurred placeholder of a stored thumbnail.
+        
+        Args:
+            name: Thumbnail name returned by ``thumbnail``
+            size: Width and height of the placeholder in pixels
+            
+        Returns:
+            ``data:`` URL of the placeholder, or None if it could not be made
+        """
+        try:
+            with Image.open(self.path(name)) as image:
+                image = image.convert("RGB" if self.image_format == "jpeg" else "RGBA")
+                image = image.resize((size, size), Image.BOX).filter(ImageFilter.GaussianBlur(0.5))
+                output = io.BytesIO()
+                image.save(output, format=self.image_format.upper(), quality=50)
+        except OSError as e:
+            logger.warning(f"Could not create avatar placeholder from {name}: {e}")
+            return None
+        
+        encoded = base64.b64encode(output.getvalue()).decode("ascii")
+        return f"data:image/{self.image_format};base64,{encoded}"
+    
+    def _encode(self, content: bytes) -> bytes:
+        """Crop an image to a centered square, resize and re-encode it."""
+        with Image.open(io.BytesIO(content)) as image:
+            image = ImageOps.exif_transpose(image)
+            has_alpha = image.mode in ("RGBA", "LA", "PA") or "transparency" in image.info
+            if self.image_format == "jpeg" or not has_alpha:
+                image = image.convert("RGB")
+            else:
+                image = image.convert("RGBA")
+            image = ImageOps.fit(image, (self.size, self.size), Image.LANCZOS)
+            
+            output = io.BytesIO()
+            image.save(output, format=self.image_format.upper(), quality=self.quality)
+            return output.getvalue()
+    
+    def _store(self, data: bytes) -> str:
+        """Write encoded thumbnail bytes to the store and return their name."""
+        name = f"{hashlib.sha256(data).hexdigest()[:16]}.{self.EXTENSIONS[self.image_format]}"
+        path = self.path(name)
+        if path.exists():
+            return name
+        
+        write_atomic(path, data)
+        return name
+    
+    def prune(self, keep: Iterable[str]) -> None:
+        """Remove stored thumbnails that are not in ``keep``."""
+        if not self.store_dir.exists():
+            return
+        
+        keep = set(keep)
+        for path in self.store_dir.iterdir():
+            if path.is_file() and path.name not in keep:
+                path.unlink()
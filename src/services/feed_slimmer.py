@@ -0,0 +1,88 @@
+"""Post-processing that shrinks feed entries for the frontend."""
+
+from typing import Any, Dict, List, Sequence
+import logging
+
+from ..utils.dates import entry_timestamp, to_iso
+from ..utils.text import strip_html as html_to_text, truncate_graphemes
+
+logger = logging.getLogger(__name__)
+
+
+class FeedSlimmer:
+    """Strip, truncate, normalize and deduplicate feed entries."""
+    
+    def __init__(
+        self,
+        strip_html: bool = True,
+        summary_length: int = 200,
+        iso_dates: bool = True,
+        drop_fields: Sequence[str] = ("published_parsed",),
+        drop_empty: bool = True,
+        dedupe: bool = True
+    ):
+        """
+        Initialize the slimmer.
+        
+        Args:
+            strip_html: Convert HTML summaries and titles to plain text
+            summary_length: Maximum summary length in characters (0 drops
+                the summary)
+            iso_dates: Rewrite ``published`` as an ISO 8601 UTC string
+            drop_fields: Entry fields to remove
+            drop_empty: Remove fields whose value is None or empty
+            dedupe: Keep only the first entry per link
+        """
+        self.strip_html = strip_html
+        self.summary_length = summary_length
+        self.iso_dates = iso_dates
+        self.drop_fields = set(drop_fields)
+        self.drop_empty = drop_empty
+        self.dedupe = dedupe
+    
+    def slim(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Return slimmed copies of feed items; the input is not modified.
+        
+        Args:
+            items: Items from ``RSSService.get_feed_content``
+            
+        Returns:
+            Slimmed items in the same order
+        """
+        seen = set()
+        slimmed = []
+        for item in items:
+            link = item.get("link")
+            if self.dedupe and link:
+                if link in seen:
+                    continue
+                seen.add(link)
+            slimmed.append(self._slim_item(item))
+        return slimmed
+    
+    def _slim_item(self, item: Dict[str, Any]) -> Dict[str, Any]:
+        result = dict(item)
+        
+        if self.iso_dates:
+            timestamp = entry_timestamp(item)
+            if timestamp is not None:
+                result["published"] = to_iso(timestamp)
+        
+        if self.strip_html:
+            for field in ("title", "summary"):
+                if isinstance(result.get(field), str):
+                    result[field] = html_to_text(result[field])
+        
+        if isinstance(result.get("summary"), str):
+            if self.summary_length > 0:
+                result["summary"] = truncate_graphemes(result["summary"], self.summary_length)
+            else:
+                result.pop("summary")
+        
+        for field in self.drop_fields:
+            result.pop(field, None)
+        if self.drop_empty:
+            result = {key: value for key, value in result.items() if value not in (None, "", [])}
+        
+        return result
@@ -2,9 +2,16 @@
 
 import os
 import requests
-from typing import List, Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from requests.structures import CaseInsensitiveDict
+from requests.utils import parse_header_links
+from typing import List, Dict, Any, Mapping, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
 import logging
 
+from ..utils.http_cache import HttpCache
+from .rate_limiter import RateLimitExceeded, RateLimitScheduler
+
 logger = logging.getLogger(__name__)
 
 
@@ -12,15 +19,58 @@ class GitHubService:
     """Service for interacting with GitHub API."""
 
     BASE_URL = "https://api.github.com"
+    
+    # Only the issue fields used by the parsers, group filters and sorting
+    ISSUES_QUERY = """
+    query($owner: String!, $name: String!, $after: String, $states: [IssueState!],
+          $since: DateTime, $orderBy: IssueOrder) {
+      repository(owner: $owner, name: $name) {
+        issues(first: 100, after: $after, states: $states,
+               filterBy: {since: $since}, orderBy: $orderBy) {
+          pageInfo { hasNextPage endCursor }
+          nodes {
+            number
+            body
+            state
+            createdAt
+            updatedAt
+            comments { totalCount }
+            labels(first: 100) { nodes { name } }
+          }
+        }
+      }
+    }
+    """
+    
+    GRAPHQL_ORDER_FIELDS = {
+        "created": "CREATED_AT",
+        "updated": "UPDATED_AT",
+        "comments": "COMMENTS",
+    }
 
-    def __init__(self, timeout: int = 10):
+    def __init__(
+        self,
+        timeout: int = 10,
+        cache: Optional[HttpCache] = None,
+        page_workers: int = 4,
+        scheduler: Optional[RateLimitScheduler] = None,
+        session: Optional[requests.Session] = None
+    ):
         """
         Initialize GitHub service.
 
         Args:
             timeout: Request timeout in seconds
+            cache: Optional HTTP cache used for conditional requests
+            page_workers: Maximum number of issue pages fetched concurrently
+            scheduler: Rate limit scheduler shared by all API calls
+            session: Shared HTTP session (a new one is created if omitted)
         """
         self.timeout = timeout
+        self.cache = cache
+        self.page_workers = page_workers
+        self.scheduler = scheduler or RateLimitScheduler()
+        self.session = session or requests.Session()
         self.headers = {
             "Accept": "application/vnd.github+json",
             "User-Agent": "hexo-friendly-links/2.2 (Python requests)",
@@ -32,6 +82,11 @@ class GitHubService:
         else:
             logger.warning("No GITHUB_TOKEN found, using unauthenticated requests (60 req/hour limit)")
     
+    @property
+    def authenticated(self) -> bool:
+        """Whether requests are sent with a GitHub token."""
+        return "Authorization" in self.headers
+    
     def get_labels(self, repo: str) -> List[Dict[str, Any]]:
         """
         Get labels from a repository.
@@ -48,14 +103,10 @@ class GitHubService:
         url = f"{self.BASE_URL}/repos/{repo}/labels"
         
         try:
-            response = requests.get(
-                url,
-                headers=self.headers,
-                timeout=self.timeout
-            )
-            response.raise_for_status()
+            labels, _ = self._get_json(url)
+            if self.cache:
+                self.cache.save()
             
-            labels = response.json()
             logger.info(f"Retrieved {len(labels)} labels from {repo}")
             return labels
             
@@ -68,7 +119,8 @@ class GitHubService:
         repo: str,
         labels: Optional[List[str]] = None,
         state: str = "all",
-        sort: str = "created"
+        sort: str = "created",
+        since: Optional[str] = None
     ) -> List[Dict[str, Any]]:
         """
         Get issues from a repository with pagination support.
@@ -78,6 +130,7 @@ class GitHubService:
             labels: List of labels to filter by
             state: Issue state (all, open, closed)
             sort: Sort order
+            since: Only return issues updated at or after this ISO 8601 time
             
         Returns:
             List of issue data
@@ -85,31 +138,135 @@ class GitHubService:
         Raises:
             requests.RequestException: If API request fails
         """
-        all_issues = []
-        page = 1
         per_page = 100
+        query = {
+            "repo": repo,
+            "labels": labels or [],
+            "state": state,
+            "sort": sort,
+            "per_page": per_page,
+            "since": since,
+        }
         
-        while True:
-            issues = self._get_issues_page(
-                repo=repo,
-                labels=labels or [],
-                state=state,
-                sort=sort,
-                page=page,
-                per_page=per_page
-            )
-            
+        issues, headers = self._get_issues_page(page=1, **query)
+        all_issues = list(issues)
+        page = 1
+        
+        # Fetch the pages announced by the Link header concurrently;
+        # pool.map keeps them in page order.
+        last_page = self._last_page(headers) if len(issues) == per_page else 1
+        if last_page > 1:
+            pages = list(range(2, last_page + 1))
+            with ThreadPoolExecutor(max_workers=min(self.page_workers, len(pages))) as pool:
+                results = pool.map(lambda number: self._get_issues_page(page=number, **query)[0], pages)
+                for issues in results:
+                    all_issues.extend(issues)
+            page = last_page
+        
+        # Without a Link header (or if issues were added while fetching),
+        # keep paging until we get fewer issues than per_page
+        while len(issues) == per_page:
+            page += 1
+            issues, _ = self._get_issues_page(page=page, **query)
             all_issues.extend(issues)
+        
+        if self.cache:
+            self.cache.save()
+        
+        logger.info(f"Retrieved {len(all_issues)} issues from {repo}")
+        return all_issues
+    
+    def get_issues_graphql(
+        self,
+        repo: str,
+        state: str = "all",
+        sort: str = "created",
+        since: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Get issues through the GraphQL API, requesting only needed fields.
+        
+        Issues are returned in the same shape as the REST API (``number``,
+        ``body``, ``state``, ``labels``, ``created_at``, ``updated_at``,
+        ``comments``), so the parsers and group filters accept them as is.
+        Unlike the REST endpoint, pull requests are not included.
+        
+        Args:
+            repo: Repository in format 'owner/repo'
+            state: Issue state (all, open, closed)
+            sort: Sort order
+            since: Only return issues updated at or after this ISO 8601 time
+            
+        Returns:
+            List of issue data
+            
+        Raises:
+            requests.RequestException: If API request fails
+        """
+        owner, name = repo.split("/")
+        variables = {
+            "owner": owner,
+            "name": name,
+            "after": None,
+            "states": None if state == "all" else [state.upper()],
+            "since": since,
+            "orderBy": {
+                "field": self.GRAPHQL_ORDER_FIELDS.get(sort.split("-", 1)[0], "CREATED_AT"),
+                "direction": "DESC",
+            },
+        }
+        
+        all_issues = []
+        while True:
+            connection = self._query_issues_graphql(repo, variables)
+            all_issues.extend(self._issue_from_graphql(node) for node in connection["nodes"])
             
-            # If we got fewer issues than per_page, we've reached the end
-            if len(issues) < per_page:
+            page_info = connection["pageInfo"]
+            if not page_info["hasNextPage"]:
                 break
-                
-            page += 1
+            variables["after"] = page_info["endCursor"]
         
-        logger.info(f"Retrieved {len(all_issues)} issues from {repo}")
+        logger.info(f"Retrieved {len(all_issues)} issues from {repo} via GraphQL")
         return all_issues
     
+    def _query_issues_graphql(self, repo: str, variables: Dict[str, Any]) -> Dict[str, Any]:
+        """Run one page of the issues GraphQL query."""
+        try:
+            response = self.scheduler.request(
+                lambda: self.session.post(
+                    f"{self.BASE_URL}/graphql",
+                    json={"query": self.ISSUES_QUERY, "variables": variables},
+                    headers=self.headers,
+                    timeout=self.timeout
+                ),
+                resource="graphql"
+            )
+            response.raise_for_status()
+            
+            payload = response.json()
+            if payload.get("errors"):
+                messages = "; ".join(error.get("message", "") for error in payload["errors"])
+                raise requests.RequestException(f"GraphQL query failed: {messages}")
+            
+            return payload["data"]["repository"]["issues"]
+            
+        except requests.RequestException as e:
+            logger.error(f"Failed to query issues of {repo} via GraphQL: {e}")
+            raise
+    
+    @staticmethod
+    def _issue_from_graphql(node: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert a GraphQL issue node to the REST issue shape."""
+        return {
+            "number": node["number"],
+            "body": node.get("body") or "",
+            "state": node["state"].lower(),
+            "labels": node["labels"]["nodes"],
+            "created_at": node["createdAt"],
+            "updated_at": node["updatedAt"],
+            "comments": node["comments"]["totalCount"],
+        }
+    
     def _get_issues_page(
         self,
         repo: str,
@@ -117,9 +274,10 @@ class GitHubService:
         state: str,
         sort: str,
         page: int,
-        per_page: int
-    ) -> List[Dict[str, Any]]:
-        """Get a single page of issues."""
+        per_page: int,
+        since: Optional[str] = None
+    ) -> Tuple[List[Dict[str, Any]], Mapping[str, str]]:
+        """Get a single page of issues along with its response headers."""
         url = f"{self.BASE_URL}/repos/{repo}/issues"
         
         params = {
@@ -131,20 +289,85 @@ class GitHubService:
         
         if labels:
             params["labels"] = ",".join(labels)
+        if since:
+            params["since"] = since
         
         try:
-            response = requests.get(
-                url,
-                params=params,
-                headers=self.headers,
-                timeout=self.timeout
-            )
-            response.raise_for_status()
-            
-            issues = response.json()
+            # `since` changes every run, so its responses could never be revalidated;
+            # the issue snapshot is the fallback for incremental fetches instead
+            issues, headers = self._get_json(url, params, use_cache=not since)
             logger.debug(f"Retrieved page {page} with {len(issues)} issues")
-            return issues
+            return issues, headers
             
         except requests.RequestException as e:
             logger.error(f"Failed to get issues page {page} from {repo}: {e}")
-            raise 
\ No newline at end of file
+            raise
+    
+    @staticmethod
+    def _last_page(headers: Mapping[str, str]) -> int:
+        """Read the last page number from a ``Link`` response header."""
+        for link in parse_header_links(headers.get("Link", "")):
+            if link.get("rel") == "last":
+                page = parse_qs(urlparse(link["url"]).query).get("page", ["1"])[0]
+                return int(page) if page.isdigit() else 1
+        return 1
+    
+    def _get_json(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        use_cache: bool = True
+    ) -> Tuple[Any, Mapping[str, str]]:
+        """
+        GET a JSON resource, revalidating against the HTTP cache if enabled.
+        
+        A ``304 Not Modified`` response reuses the cached payload and headers;
+        GitHub does not count those against the rate limit.
+        
+        Args:
+            url: Resource URL
+            params: Query parameters
+            use_cache: Whether to look up and store the response in the
+                HTTP cache
+        
+        Returns:
+            Decoded payload and the response headers
+        
+        Raises:
+            requests.RequestException: If API request fails
+        """
+        headers = self.headers
+        entry = None
+        key = HttpCache.key(url, params)
+        cache = self.cache if use_cache else None
+        
+        if cache:
+            entry = cache.get(key)
+            headers = dict(self.headers, **HttpCache.conditional_headers(entry))
+        
+        try:
+            response = self.scheduler.request(lambda: self.session.get(
+                url,
+                params=params,
+                headers=headers,
+                timeout=self.timeout
+            ))
+        except RateLimitExceeded as e:
+            if entry is None:
+                raise
+            logger.warning(f"{e}; using cached response for {key}")
+            return entry["body"], CaseInsensitiveDict(entry["headers"])
+        
+        if response.status_code == 304 and entry is not None:
+            logger.debug(f"Not modified, using cached response for {key}")
+            headers = CaseInsensitiveDict(entry["headers"])
+            headers.update(response.headers)
+            return entry["body"], headers
+        
+        response.raise_for_status()
+        payload = response.json()
+        
+        if cache:
+            cache.store(key, response.headers, payload)
+        
+        return payload, response.headers
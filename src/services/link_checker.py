@@ -1,30 +1,238 @@
 """Service for checking link availability."""
 
+import codecs
 import requests
-from typing import Literal
+import time
+from collections import defaultdict
+from html.parser import HTMLParser
+from typing import Any, Dict, Iterable, List, Literal, Optional, Tuple
+from urllib.parse import urljoin
 import logging
 
+from ..utils.concurrency import HostLimitedExecutor, host_of
+from ..utils.link_health import LinkHealthStore, normalize_url
+
 logger = logging.getLogger(__name__)
 
 LinkStatus = Literal["active", "404", "error"]
 
 
+class _HeadLinkParser(HTMLParser):
+    """Collect feed and icon ``<link>`` elements from an HTML head."""
+    
+    FEED_TYPES = ("application/rss+xml", "application/atom+xml")
+    
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.base: Optional[str] = None
+        self.feeds: List[str] = []
+        self.icons: List[Tuple[int, str]] = []
+        self.done = False
+    
+    def handle_starttag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]) -> None:
+        if tag == "body":
+            self.done = True
+            return
+        
+        values = {name: value or "" for name, value in attrs}
+        href = values.get("href", "").strip()
+        if not href:
+            return
+        
+        if tag == "base" and self.base is None:
+            self.base = href
+        elif tag == "link":
+            rel = values.get("rel", "").lower().split()
+            if "alternate" in rel and values.get("type", "").lower() in self.FEED_TYPES:
+                self.feeds.append(href)
+            elif "apple-touch-icon" in rel:
+                # Touch icons are larger, so they make better avatars
+                self.icons.append((0, href))
+            elif "icon" in rel:
+                self.icons.append((1, href))
+    
+    def handle_endtag(self, tag: str) -> None:
+        if tag == "head":
+            self.done = True
+
+
 class LinkChecker:
     """Service for checking if links are accessible."""
     
-    def __init__(self, timeout: int = 5):
+    def __init__(
+        self,
+        timeout: int = 5,
+        session: Optional[requests.Session] = None,
+        health_store: Optional[LinkHealthStore] = None,
+        max_probe_bytes: int = 64 * 1024
+    ):
         """
         Initialize link checker.
         
         Args:
             timeout: Request timeout in seconds
+            session: Shared HTTP session (a new one is created if omitted)
+            health_store: Optional store used to skip recently checked URLs
+            max_probe_bytes: Maximum homepage bytes read when discovering links
         """
         self.timeout = timeout
+        self.session = session or requests.Session()
+        self.health_store = health_store
+        self.max_probe_bytes = max_probe_bytes
+    
+    def check_many(
+        self,
+        urls: Iterable[str],
+        executor: Optional[HostLimitedExecutor] = None,
+        probe: str = "head",
+        discover: Iterable[str] = ()
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Check many URLs concurrently, requesting each distinct URL once.
+        
+        URLs are deduplicated after normalization, so entries sharing a
+        homepage cost a single request.
+        
+        Args:
+            urls: URLs to check
+            executor: Executor to run the checks on (a private one is used
+                if omitted)
+            probe: "head" for a HEAD request, "combined" for a homepage GET
+            discover: URLs whose feed and icon links should be discovered
+                (combined probe only)
+            
+        Returns:
+            Mapping of every non-empty input URL to its check result, see
+            ``check``
+        """
+        urls = [url for url in urls if isinstance(url, str) and url.strip()]
+        unique: Dict[str, str] = {}
+        for url in urls:
+            unique.setdefault(normalize_url(url), url)
+        discover_keys = {normalize_url(url) for url in discover if isinstance(url, str)}
+        
+        own_executor = executor is None
+        if own_executor:
+            executor = HostLimitedExecutor()
+        try:
+            futures = {
+                key: executor.submit(url, self.check, url, probe, key in discover_keys)
+                for key, url in unique.items()
+            }
+            by_key = {key: future.result() for key, future in futures.items()}
+        finally:
+            if own_executor:
+                executor.shutdown()
+        
+        return {url: by_key[normalize_url(url)] for url in urls}
+    
+    def check(self, url: str, probe: str = "head", discover: bool = False) -> Dict[str, Any]:
+        """
+        Check one URL, reusing its health record while it is fresh.
+        
+        Args:
+            url: URL to check
+            probe: "head" for a HEAD request, "combined" for a homepage GET
+            discover: Whether to discover feed and icon links (combined only)
+            
+        Returns:
+            Dict with ``status`` ("active", "404" or "error"), ``reachable``
+            (any HTTP response was received), ``code``, ``latency``
+            (milliseconds), ``redirects``, ``final_url`` and ``cached``; plus
+            ``feed`` and ``icon`` once discovered
+        """
+        if self.health_store:
+            record = self.health_store.get_fresh(url)
+            if record and "reachable" in record and (not discover or "feed" in record):
+                logger.debug(f"Using cached status for {url}: {record['status']}")
+                return dict(record, cached=True)
+            # Re-check, but skip parsing if the page was parsed before
+            discover = discover and "feed" not in (self.health_store.get(url) or {})
+        
+        if probe == "combined":
+            result = self.probe_homepage(url, discover=discover)
+        else:
+            result = self._head(url)
+        status = self._status_for(url, result)
+        
+        if self.health_store:
+            fields = {key: value for key, value in result.items() if key != "latency"}
+            record = self.health_store.record(
+                url, status, result["latency"], healthy=status == "active", **fields
+            )
+            return dict(record, cached=False)
+        return dict(result, status=status, cached=False)
+    
+    def probe_homepage(self, url: str, discover: bool = True) -> Dict[str, Any]:
+        """
+        Check a homepage with one GET and discover its feed and icon.
+        
+        The response is streamed and only read up to the end of ``<head>``
+        (at most ``max_probe_bytes``), so the page body is never downloaded.
+        
+        Args:
+            url: Homepage URL
+            discover: Whether to parse the head for feed and icon links
+            
+        Returns:
+            Dict with ``reachable``, ``code``, ``final_url``, ``redirects``,
+            ``error``, ``latency`` (milliseconds) and, if discovering,
+            ``feed`` and ``icon`` URLs (None when not found)
+        """
+        start_time = time.perf_counter()
+        result = self._empty_result(url)
+        
+        try:
+            with self.session.get(
+                url.strip(),
+                timeout=self.timeout,
+                allow_redirects=True,
+                stream=True,
+                headers={"Accept": "text/html,application/xhtml+xml;q=0.9,*/*;q=0.8"}
+            ) as response:
+                result.update(self._response_fields(response))
+                
+                if discover:
+                    result.update(feed=None, icon=None)
+                    content_type = response.headers.get("content-type", "").lower()
+                    if response.ok and "html" in content_type:
+                        result.update(self._discover_links(response))
+                        
+        except Exception as e:
+            result["error"] = self._error_kind(url, e)
+        
+        result["latency"] = round((time.perf_counter() - start_time) * 1000)
+        return result
+    
+    def _discover_links(self, response: requests.Response) -> Dict[str, Optional[str]]:
+        """Parse feed and icon links from the head of a streamed HTML response."""
+        parser = _HeadLinkParser()
+        try:
+            decoder = codecs.getincrementaldecoder(response.encoding or "utf-8")(errors="replace")
+        except LookupError:
+            decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        
+        read = 0
+        for chunk in response.iter_content(chunk_size=8192):
+            parser.feed(decoder.decode(chunk))
+            read += len(chunk)
+            if parser.done or read >= self.max_probe_bytes:
+                break
+        
+        base = urljoin(response.url, parser.base or "")
+        icons = [href for _, href in sorted(parser.icons, key=lambda icon: icon[0])]
+        return {
+            "feed": urljoin(base, parser.feeds[0]) if parser.feeds else None,
+            "icon": urljoin(base, icons[0]) if icons else None,
+        }
     
     def check_link(self, url: str) -> LinkStatus:
         """
         Check if a link is accessible.
         
+        URLs checked recently enough according to the health store are not
+        requested again; their last status is returned instead.
+        
         Args:
             url: URL to check
             
@@ -34,29 +242,88 @@ class LinkChecker:
         if not url or not url.strip():
             return "404"
         
+        return self.check(url)["status"]
+    
+    def _head(self, url: str) -> Dict[str, Any]:
+        """Send a HEAD request following redirects."""
+        start_time = time.perf_counter()
+        result = self._empty_result(url)
+        
         try:
-            response = requests.head(
+            response = self.session.head(
                 url.strip(),
                 timeout=self.timeout,
                 allow_redirects=True
             )
-            
-            if response.status_code < 400:
-                logger.debug(f"Link {url} is active (status: {response.status_code})")
-                return "active"
-            else:
-                logger.debug(f"Link {url} returned status {response.status_code}")
-                return "404"
-                
-        except requests.exceptions.Timeout:
+            result.update(self._response_fields(response))
+        except Exception as e:
+            result["error"] = self._error_kind(url, e)
+        
+        result["latency"] = round((time.perf_counter() - start_time) * 1000)
+        return result
+    
+    @staticmethod
+    def _empty_result(url: str) -> Dict[str, Any]:
+        return {"reachable": False, "code": None, "final_url": url, "redirects": 0, "error": None}
+    
+    @staticmethod
+    def _response_fields(response: requests.Response) -> Dict[str, Any]:
+        return {
+            "reachable": True,
+            "code": response.status_code,
+            "final_url": response.url,
+            "redirects": len(response.history),
+        }
+    
+    @staticmethod
+    def _error_kind(url: str, error: Exception) -> str:
+        """Log a failed request and classify the error."""
+        if isinstance(error, requests.exceptions.Timeout):
             logger.warning(f"Timeout checking link: {url}")
-            return "error"
-        except requests.exceptions.ConnectionError:
+            return "timeout"
+        if isinstance(error, requests.exceptions.ConnectionError):
             logger.warning(f"Connection error checking link: {url}")
+            return "connection"
+        if isinstance(error, requests.exceptions.RequestException):
+            logger.warning(f"Request error checking link {url}: {error}")
+            return "request"
+        logger.error(f"Unexpected error checking link {url}: {error}")
+        return "unexpected"
+    
+    @staticmethod
+    def _status_for(url: str, result: Dict[str, Any]) -> LinkStatus:
+        """Map a request result to a link status."""
+        if result["reachable"]:
+            if result["code"] < 400:
+                logger.debug(f"Link {url} is active (status: {result['code']})")
+                return "active"
+            logger.debug(f"Link {url} returned status {result['code']}")
             return "404"
-        except requests.exceptions.RequestException as e:
-            logger.warning(f"Request error checking link {url}: {e}")
-            return "error"
-        except Exception as e:
-            logger.error(f"Unexpected error checking link {url}: {e}")
-            return "error" 
\ No newline at end of file
+        return "404" if result["error"] == "connection" else "error"
+    
+    @staticmethod
+    def summarize(results: Dict[str, Dict[str, Any]], top: int = 5) -> Dict[str, Any]:
+        """
+        Summarize a ``check_many`` result for reporting.
+        
+        Args:
+            results: Result of ``check_many``
+            top: Number of slowest hosts to report
+            
+        Returns:
+            Dict with ``unique``, ``cached`` and ``requested`` counts and the
+            ``slowest_hosts`` as (host, total milliseconds) pairs
+        """
+        unique = {id(result): result for result in results.values()}.values()
+        requested = [result for result in unique if not result["cached"]]
+        
+        host_latency: Dict[str, int] = defaultdict(int)
+        for result in requested:
+            host_latency[host_of(result["final_url"])] += result["latency"]
+        
+        return {
+            "unique": len(unique),
+            "cached": len(unique) - len(requested),
+            "requested": len(requested),
+            "slowest_hosts": sorted(host_latency.items(), key=lambda item: item[1], reverse=True)[:top],
+        }
@@ -0,0 +1,165 @@
+"""Rate-limit-aware scheduling of GitHub API requests."""
+
+import random
+import threading
+import time
+from typing import Any, Callable, Dict, Mapping, Optional
+import logging
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimitExceeded(requests.RequestException):
+    """Raised when the GitHub API budget is exhausted for longer than we may wait."""
+
+
+class RateLimitScheduler:
+    """
+    Track GitHub's rate-limit budget and pace requests accordingly.
+    
+    The budget is read from the ``X-RateLimit-*`` headers of every response,
+    separately per resource (``core`` for REST, ``graphql``). When the budget
+    runs low, requests are spread evenly over the time left until the reset.
+    Secondary rate limits (403/429 with ``Retry-After`` or no reset header)
+    are retried with jittered exponential backoff.
+    """
+    
+    # Start pacing once fewer than this share of the limit is left
+    PACING_THRESHOLD = 0.1
+    
+    def __init__(self, max_wait: float = 60, max_retries: int = 3, backoff: float = 1.0):
+        """
+        Initialize the scheduler.
+        
+        Args:
+            max_wait: Longest single wait in seconds before giving up
+            max_retries: Retries after a rate-limited response
+            backoff: Base delay in seconds for secondary rate limit backoff
+        """
+        self.max_wait = max_wait
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self._lock = threading.Lock()
+        self._limits: Dict[str, Dict[str, Any]] = {}
+        self._next_slot: Dict[str, float] = {}
+        self.requests = 0
+        self.not_modified = 0
+        self.retries = 0
+    
+    @property
+    def budget(self) -> Dict[str, Any]:
+        """Snapshot of the calls made and the budget left per resource."""
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "not_modified": self.not_modified,
+                "retries": self.retries,
+                "resources": {name: dict(limit) for name, limit in self._limits.items()},
+            }
+    
+    def request(self, send: Callable[[], requests.Response], resource: str = "core") -> requests.Response:
+        """
+        Send a request through the scheduler.
+        
+        Args:
+            send: Callable performing the HTTP request
+            resource: Rate limit resource the request counts against
+            
+        Returns:
+            The first response that was not rate limited
+            
+        Raises:
+            RateLimitExceeded: If the budget is exhausted or retries run out
+        """
+        for attempt in range(self.max_retries + 1):
+            self._wait_for_slot(resource)
+            response = send()
+            self._record(response, resource)
+            
+            delay = self._retry_delay(response, attempt)
+            if delay is None:
+                return response
+            
+            if attempt == self.max_retries or delay > self.max_wait:
+                raise RateLimitExceeded(
+                    f"GitHub rate limit hit ({response.status_code}), retry in {delay:.0f}s"
+                )
+            
+            logger.warning(f"GitHub rate limit hit, retrying in {delay:.1f}s")
+            with self._lock:
+                self.retries += 1
+            time.sleep(delay)
+        
+        raise RateLimitExceeded("GitHub rate limit retries exhausted")
+    
+    def _wait_for_slot(self, resource: str) -> None:
+        """Block until the next request for ``resource`` may be sent."""
+        with self._lock:
+            now = time.time()
+            limit = self._limits.get(resource)
+            delay = 0.0
+            
+            if limit and limit["remaining"] is not None and limit["reset"]:
+                until_reset = max(0.0, limit["reset"] - now)
+                if limit["remaining"] <= 0 and until_reset > 0:
+                    if until_reset > self.max_wait:
+                        raise RateLimitExceeded(
+                            f"GitHub {resource} budget exhausted until reset in {until_reset:.0f}s"
+                        )
+                    delay = until_reset
+                elif limit["limit"] and limit["remaining"] < limit["limit"] * self.PACING_THRESHOLD:
+                    interval = until_reset / max(limit["remaining"], 1)
+                    slot = max(now, self._next_slot.get(resource, now))
+                    self._next_slot[resource] = slot + interval
+                    delay = min(slot - now, self.max_wait)
+        
+        if delay > 0:
+            logger.debug(f"Pacing GitHub {resource} request for {delay:.2f}s")
+            time.sleep(delay)
+    
+    def _record(self, response: requests.Response, resource: str) -> None:
+        """Update the budget from a response's rate limit headers."""
+        headers = response.headers
+        with self._lock:
+            self.requests += 1
+            if response.status_code == 304:
+                self.not_modified += 1
+            
+            if "X-RateLimit-Remaining" not in headers:
+                return
+            
+            resource = headers.get("X-RateLimit-Resource", resource)
+            self._limits[resource] = {
+                "remaining": _to_int(headers.get("X-RateLimit-Remaining")),
+                "limit": _to_int(headers.get("X-RateLimit-Limit")),
+                "reset": _to_int(headers.get("X-RateLimit-Reset")),
+            }
+    
+    def _retry_delay(self, response: requests.Response, attempt: int) -> Optional[float]:
+        """Seconds to wait before retrying, or None if not rate limited."""
+        if response.status_code not in (403, 429):
+            return None
+        
+        headers: Mapping[str, str] = response.headers
+        retry_after = _to_int(headers.get("Retry-After"))
+        if retry_after is not None:
+            return float(retry_after)
+        
+        if headers.get("X-RateLimit-Remaining") == "0":
+            reset = _to_int(headers.get("X-RateLimit-Reset")) or 0
+            return max(0.0, reset - time.time()) + 1
+        
+        if response.status_code == 429 or "secondary rate limit" in response.text.lower():
+            return self.backoff * (2 ** attempt) + random.uniform(0, self.backoff)
+        
+        # A plain 403 (e.g. missing permission) is not a rate limit
+        return None
+
+
+def _to_int(value: Optional[str]) -> Optional[int]:
+    try:
+        return int(value) if value is not None else None
+    except ValueError:
+        return None
@@ -1,9 +1,14 @@
 """Service for parsing RSS feeds."""
 
 import feedparser
+import heapq
+import requests
 from typing import List, Dict, Any, Optional
 import logging
 
+from ..utils.http_cache import HttpCache
+from ..utils.http_client import read_bounded
+
 logger = logging.getLogger(__name__)
 
 
@@ -12,10 +17,39 @@ class RSSService:
     
     USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36 Edg/120.0.0.0"
     
+    def __init__(
+        self,
+        cache: Optional[HttpCache] = None,
+        session: Optional[requests.Session] = None,
+        streaming: bool = False,
+        max_bytes: int = 1024 * 1024,
+        timeout: int = 10
+    ):
+        """
+        Initialize RSS service.
+        
+        Args:
+            cache: Optional cache of feed validators and extracted items
+            session: Shared HTTP session used in streaming mode
+            streaming: Download feeds ourselves with a byte and time budget
+                instead of letting feedparser fetch them
+            max_bytes: Maximum feed bytes downloaded in streaming mode
+            timeout: Time budget in seconds per feed in streaming mode
+        """
+        self.cache = cache
+        self.session = session or requests.Session()
+        self.streaming = streaming
+        self.max_bytes = max_bytes
+        self.timeout = timeout
+    
     def get_feed_content(self, rss_url: str, max_items: int = 10) -> List[Dict[str, Any]]:
         """
         Parse RSS feed and return recent entries.
         
+        With a cache, the feed is requested conditionally: a ``304 Not
+        Modified`` answer reuses the stored items, and so does a changed
+        feed whose newest entry is still the same.
+        
         Args:
             rss_url: URL of the RSS feed
             max_items: Maximum number of items to return
@@ -30,41 +64,139 @@ class RSSService:
         try:
             logger.debug(f"Parsing RSS feed: {rss_url}")
             
-            feed = feedparser.parse(
-                rss_url.strip(),
-                agent=self.USER_AGENT
-            )
+            key = rss_url.strip()
+            cached = self._cached_feed(key, max_items)
+            validators = cached["headers"] if cached else {}
             
-            if feed.bozo:
-                logger.warning(f"RSS feed has parsing issues: {rss_url}")
+            if self.streaming:
+                feed = self._parse_streamed(key, cached)
+            else:
+                feed = feedparser.parse(
+                    key,
+                    agent=self.USER_AGENT,
+                    etag=validators.get("ETag"),
+                    modified=validators.get("Last-Modified")
+                )
             
-            items = []
-            for entry in feed.entries:
-                item = {
-                    "title": getattr(entry, "title", ""),
-                    "link": getattr(entry, "link", ""),
-                    "published": getattr(entry, "published", None),
-                    "published_parsed": getattr(entry, "published_parsed", None),
-                    "author": getattr(entry, "author", None),
-                    "summary": getattr(entry, "summary", None),
-                }
-                items.append(item)
+            if cached and feed.get("status") == 304:
+                logger.debug(f"RSS feed not modified: {rss_url}")
+                return self._copy_items(cached["body"]["items"][:max_items])
             
-            # Sort by published date (newest first)
-            # Filter out items with None published_parsed first
-            items_with_date = [item for item in items if item["published_parsed"]]
-            items_without_date = [item for item in items if not item["published_parsed"]]
+            if feed.bozo:
+                logger.warning(f"RSS feed has parsing issues: {rss_url}")
             
-            items_with_date = sorted(items_with_date, key=lambda x: x["published_parsed"], reverse=True)
-            items = items_with_date + items_without_date
+            newest = self._newest_entry_id(feed.entries)
+            if cached and newest and cached["body"].get("newest") == newest:
+                logger.debug(f"Newest RSS entry unchanged, reusing items: {rss_url}")
+                items = self._copy_items(cached["body"]["items"])
+            else:
+                items = self._extract_items(feed.entries, max_items)
             
             # Limit the number of items
             if len(items) > max_items:
                 items = items[:max_items]
             
+            if self.cache:
+                self.cache.store(
+                    key,
+                    {"ETag": feed.get("etag"), "Last-Modified": feed.get("modified")},
+                    {"items": self._copy_items(items), "newest": newest, "max_items": max_items},
+                    require_validators=False
+                )
+            
             logger.debug(f"Successfully parsed {len(items)} items from RSS feed")
             return items
             
         except Exception as e:
             logger.warning(f"Failed to parse RSS feed {rss_url}: {e}")
-            return [] 
\ No newline at end of file
+            return []
+    
+    def _cached_feed(self, key: str, max_items: int) -> Optional[Dict[str, Any]]:
+        """Return the cached feed if it holds enough items for ``max_items``."""
+        if not self.cache:
+            return None
+        cached = self.cache.get(key)
+        if cached and cached["body"].get("max_items", 0) >= max_items:
+            return cached
+        return None
+    
+    @staticmethod
+    def _copy_items(items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Copy items so callers never mutate the cached ones."""
+        return [dict(item) for item in items]
+    
+    @staticmethod
+    def _newest_entry_id(entries: List[Any]) -> Optional[str]:
+        """Identify the newest dated entry with a single linear scan."""
+        newest = None
+        for entry in entries:
+            published = getattr(entry, "published_parsed", None)
+            if published and (newest is None or published > newest[0]):
+                newest = (published, entry)
+        
+        if newest is None:
+            return None
+        published, entry = newest
+        identity = getattr(entry, "id", None) or getattr(entry, "link", "")
+        return f"{identity}@{published[:6]}"
+    
+    def _parse_streamed(self, url: str, cached: Optional[Dict[str, Any]]) -> feedparser.FeedParserDict:
+        """
+        Download a feed through the shared session within the byte and time
+        budget, then parse it.
+        
+        A truncated document still yields the entries read so far, since
+        feedparser falls back to its lenient parser.
+        """
+        headers = {"User-Agent": self.USER_AGENT, **HttpCache.conditional_headers(cached)}
+        
+        with self.session.get(url, headers=headers, timeout=self.timeout, stream=True) as response:
+            if response.status_code == 304:
+                return feedparser.FeedParserDict(status=304, entries=[], bozo=False)
+            response.raise_for_status()
+            
+            content, complete = read_bounded(response, self.max_bytes, self.timeout)
+            if not complete:
+                logger.warning(f"RSS feed exceeded its download budget, parsing the first {len(content)} bytes: {url}")
+            
+            feed = feedparser.parse(
+                content,
+                response_headers={
+                    "content-type": response.headers.get("content-type", ""),
+                    "content-location": response.url,
+                }
+            )
+            feed["status"] = response.status_code
+            feed["etag"] = response.headers.get("ETag")
+            feed["modified"] = response.headers.get("Last-Modified")
+            return feed
+    
+    @staticmethod
+    def _extract_items(entries: List[Any], max_items: int) -> List[Dict[str, Any]]:
+        """
+        Build item dicts for the newest ``max_items`` entries.
+        
+        Uses a bounded heap instead of sorting every entry, and only builds
+        dicts for the entries that are kept; the result is the same as a
+        stable sort by date, newest first, with undated entries last.
+        """
+        # Select by published date (newest first)
+        # Entries with None published_parsed only fill up the remainder
+        dated = [entry for entry in entries if getattr(entry, "published_parsed", None)]
+        selected = heapq.nlargest(max_items, dated, key=lambda entry: entry.published_parsed)
+        if len(selected) < max_items:
+            undated = (entry for entry in entries if not getattr(entry, "published_parsed", None))
+            selected.extend(entry for _, entry in zip(range(max_items - len(selected)), undated))
+        
+        items = []
+        for entry in selected:
+            item = {
+                "title": getattr(entry, "title", ""),
+                "link": getattr(entry, "link", ""),
+                "published": getattr(entry, "published", None),
+                "published_parsed": getattr(entry, "published_parsed", None),
+                "author": getattr(entry, "author", None),
+                "summary": getattr(entry, "summary", None),
+            }
+            items.append(item)
+        return items
@@ -0,0 +1,110 @@
+"""Global "latest posts" timeline across all friends' feeds."""
+
+import heapq
+from itertools import islice, takewhile
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+import logging
+
+from ..utils.dates import entry_timestamp, parse_iso, to_iso
+
+logger = logging.getLogger(__name__)
+
+TimedPost = Tuple[float, Dict[str, Any]]
+
+
+class TimelineBuilder:
+    """Merge every friend's newest posts into one timeline."""
+    
+    def __init__(self, limit: int = 50):
+        """
+        Initialize the timeline builder.
+        
+        Args:
+            limit: Maximum number of posts in the timeline
+        """
+        self.limit = limit
+    
+    def build(
+        self,
+        entries: List[Dict[str, Any]],
+        previous: Optional[List[Dict[str, Any]]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Build the timeline from friend entries and the previous timeline.
+        
+        Each entry's ``rss`` list is already sorted newest first, so the
+        lists are combined with a k-way merge and only the first ``limit``
+        posts are ever materialized. Posts of the previous timeline are merged
+        in as one more sorted list, which keeps posts that dropped out of a
+        friend's feed window (or whose feed failed this run) as long as
+        they are recent enough; posts of friends no longer listed are dropped.
+        
+        Args:
+            entries: Friend link entries
+            previous: Timeline posts of the last run
+            
+        Returns:
+            Up to ``limit`` posts, newest first, with blog attribution
+        """
+        blogs = {entry["url"]: self._blog(entry) for entry in entries if entry.get("url")}
+        sources = [
+            self._entry_posts(entry, blogs.get(entry.get("url")) or self._blog(entry))
+            for entry in entries if entry.get("rss")
+        ]
+        if previous:
+            sources.append(self._previous_posts(previous, blogs))
+        
+        merged = heapq.merge(*sources, key=lambda post: post[0], reverse=True)
+        timeline = [post for _, post in islice(self._unique(merged), self.limit)]
+        
+        logger.info(f"Timeline holds {len(timeline)} posts from {len(sources)} sources")
+        return timeline
+    
+    @staticmethod
+    def _blog(entry: Dict[str, Any]) -> Dict[str, Any]:
+        """Attribution of a post to the friend's blog."""
+        return {
+            "title": entry.get("title", ""),
+            "url": entry.get("url", ""),
+            "avatar": entry.get("avatar", ""),
+        }
+    
+    @staticmethod
+    def _entry_posts(entry: Dict[str, Any], blog: Dict[str, Any]) -> Iterator[TimedPost]:
+        """Yield the dated posts of one friend, newest first."""
+        timed = ((entry_timestamp(item), item) for item in entry["rss"])
+        # Undated items are sorted last, so stop at the first one
+        for timestamp, item in takewhile(lambda pair: pair[0] is not None, timed):
+            yield timestamp, {
+                "title": item.get("title", ""),
+                "link": item.get("link", ""),
+                "date": to_iso(timestamp),
+                "author": item.get("author"),
+                "blog": blog,
+            }
+    
+    @staticmethod
+    def _previous_posts(
+        previous: List[Dict[str, Any]],
+        blogs: Dict[str, Dict[str, Any]]
+    ) -> List[TimedPost]:
+        """Posts of the previous timeline whose blog is still listed, newest first."""
+        posts = []
+        for post in previous:
+            timestamp = parse_iso(post.get("date", ""))
+            blog = blogs.get(post.get("blog", {}).get("url"))
+            if timestamp is not None and blog:
+                # Refresh the attribution in case the friend's details changed
+                posts.append((timestamp, dict(post, blog=blog)))
+        return sorted(posts, key=lambda pair: pair[0], reverse=True)
+    
+    @staticmethod
+    def _unique(posts: Iterable[TimedPost]) -> Iterator[TimedPost]:
+        """Drop repeated posts, keeping the first (newest) one per link."""
+        seen = set()
+        for timestamp, post in posts:
+            key = post.get("link") or (post["blog"].get("url"), post.get("title"))
+            if key in seen:
+                continue
+            seen.add(key)
+            yield timestamp, post
@@ -2,5 +2,39 @@
 
 from .logger import setup_logger
 from .config_loader import load_config
+from .concurrency import HostLimitedExecutor, host_of
+from .http_client import create_session, read_bounded
+from .http_cache import HttpCache
+from .issue_snapshot import IssueSnapshot, sort_issues
+from .group_index import GroupIndex
+from .link_health import LinkHealthStore, normalize_url
+from .dates import entry_timestamp
+from .text import strip_html, truncate_graphemes
+from .atomic_file import AtomicFile, write_atomic
+from .json_store import load_json, dump_json_atomic
+from .json_stream import iter_json
+from .output_writer import OutputWriter
 
-__all__ = ["setup_logger", "load_config"] 
\ No newline at end of file
+__all__ = [
+    "setup_logger",
+    "load_config",
+    "HostLimitedExecutor",
+    "host_of",
+    "create_session",
+    "read_bounded",
+    "HttpCache",
+    "IssueSnapshot",
+    "sort_issues",
+    "GroupIndex",
+    "LinkHealthStore",
+    "normalize_url",
+    "entry_timestamp",
+    "strip_html",
+    "truncate_graphemes",
+    "AtomicFile",
+    "write_atomic",
+    "load_json",
+    "dump_json_atomic",
+    "iter_json",
+    "OutputWriter",
+]
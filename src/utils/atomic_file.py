@@ -0,0 +1,85 @@
+"""Atomic file replacement shared by caches and generated files."""
+
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+from typing import Iterable, Optional, Union
+
+CHUNK_SIZE = 1024 * 1024
+
+
+class AtomicFile:
+    """
+    File written to a temporary sibling and renamed over ``path`` on success.
+    
+    Used as a context manager. Readers never observe a half-written file,
+    even if the run is killed while writing. Content is hashed as it is
+    written, so callers can compare it with the existing file and
+    ``discard`` it to leave that file untouched.
+    """
+    
+    def __init__(self, path: Union[str, Path], mode: int = 0o644):
+        """
+        Initialize the file.
+        
+        Args:
+            path: Destination file
+            mode: Permissions of the written file
+        """
+        self.path = Path(path)
+        self.mode = mode
+        self.size = 0
+        self._digest = hashlib.sha256()
+        self._discarded = False
+        self._file = None
+        self._tmp_path: Optional[str] = None
+    
+    def __enter__(self) -> "AtomicFile":
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, self._tmp_path = tempfile.mkstemp(dir=self.path.parent, prefix=f".{self.path.name}.", suffix=".tmp")
+        self._file = os.fdopen(fd, "wb", buffering=CHUNK_SIZE)
+        return self
+    
+    def write(self, chunk: bytes) -> None:
+        """Append a chunk to the file and the running hash."""
+        self._digest.update(chunk)
+        self._file.write(chunk)
+        self.size += len(chunk)
+    
+    def hexdigest(self) -> str:
+        """SHA-256 of the content written so far."""
+        return self._digest.hexdigest()
+    
+    def discard(self) -> None:
+        """Drop the written content instead of replacing ``path`` on exit."""
+        self._discarded = True
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        try:
+            self._file.close()
+            if exc_type is None and not self._discarded:
+                # mkstemp creates private files, published output must stay readable
+                os.chmod(self._tmp_path, self.mode)
+                os.replace(self._tmp_path, self.path)
+        finally:
+            if os.path.exists(self._tmp_path):
+                os.unlink(self._tmp_path)
+
+
+def write_atomic(path: Union[str, Path], data: Union[bytes, Iterable[bytes]], mode: int = 0o644) -> str:
+    """
+    Write bytes to ``path`` via a temporary file and rename.
+    
+    Args:
+        path: Destination file
+        data: File content, as bytes or an iterable of chunks
+        mode: Permissions of the written file
+    
+    Returns:
+        SHA-256 of the written content
+    """
+    with AtomicFile(path, mode=mode) as file:
+        for chunk in [data] if isinstance(data, bytes) else data:
+            file.write(chunk)
+    return file.hexdigest()
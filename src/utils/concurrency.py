@@ -0,0 +1,104 @@
+"""Bounded concurrent execution helpers."""
+
+import threading
+from collections import defaultdict, deque
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Deque, Dict, List, Tuple
+from urllib.parse import urlparse
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def host_of(url: str) -> str:
+    """Return the lower-cased host name of a URL, or an empty string."""
+    if not isinstance(url, str):
+        return ""
+    try:
+        return (urlparse(url.strip()).hostname or "").lower()
+    except ValueError:
+        return ""
+
+
+class HostLimitedExecutor:
+    """
+    Thread pool with a global concurrency limit and a per-host limit.
+
+    Tasks for a host that is already at its limit are queued and dispatched
+    as soon as one of that host's running tasks finishes, so a slow host never
+    ties up more than ``per_host_limit`` workers.
+    """
+
+    def __init__(self, max_workers: int = 16, per_host_limit: int = 4):
+        """
+        Initialize the executor.
+
+        Args:
+            max_workers: Maximum number of tasks running at the same time
+            per_host_limit: Maximum number of running tasks per host
+        """
+        self.max_workers = max_workers
+        self.per_host_limit = per_host_limit
+        self._pool = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="probe"
+        )
+        self._lock = threading.RLock()
+        self._active: Dict[str, int] = defaultdict(int)
+        self._pending: Dict[str, Deque[Tuple[Future, Callable, tuple, dict]]] = defaultdict(deque)
+        self._futures: List[Future] = []
+
+    def submit(self, url: str, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Future:
+        """
+        Schedule ``fn(*args, **kwargs)`` under the limit of ``url``'s host.
+
+        Args:
+            url: URL the task talks to; used only to pick the host bucket
+            fn: Callable to run
+
+        Returns:
+            Future resolving to the callable's result
+        """
+        host = host_of(url)
+        future: Future = Future()
+        with self._lock:
+            self._futures.append(future)
+            if not host or self._active[host] < self.per_host_limit:
+                self._active[host] += 1
+                self._dispatch(host, future, fn, args, kwargs)
+            else:
+                self._pending[host].append((future, fn, args, kwargs))
+        return future
+
+    def _dispatch(self, host: str, future: Future, fn: Callable, args: tuple, kwargs: dict) -> None:
+        inner = self._pool.submit(fn, *args, **kwargs)
+        inner.add_done_callback(lambda done: self._complete(host, future, done))
+
+    def _complete(self, host: str, future: Future, inner: Future) -> None:
+        exc = inner.exception()
+        if exc is not None:
+            future.set_exception(exc)
+        else:
+            future.set_result(inner.result())
+
+        with self._lock:
+            if self._pending[host]:
+                self._dispatch(host, *self._pending[host].popleft())
+            else:
+                self._active[host] -= 1
+
+    def shutdown(self) -> None:
+        """Wait for every scheduled task, then stop the worker threads."""
+        while True:
+            with self._lock:
+                outstanding = [f for f in self._futures if not f.done()]
+            if not outstanding:
+                break
+            wait(outstanding)
+        self._pool.shutdown(wait=True)
+
+    def __enter__(self) -> "HostLimitedExecutor":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.shutdown()
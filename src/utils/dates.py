@@ -0,0 +1,40 @@
+"""Date helpers for feed entries."""
+
+import calendar
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+ISO_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+
+
+def to_iso(timestamp: float) -> str:
+    """Format a UTC timestamp as an ISO 8601 string like ``2025-07-15T15:46:00Z``."""
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc).strftime(ISO_FORMAT)
+
+
+def parse_iso(value: str) -> Optional[float]:
+    """Parse an ISO 8601 string to a UTC timestamp, or None if it isn't one."""
+    try:
+        parsed = datetime.fromisoformat(value.strip().replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+def entry_timestamp(item: Dict[str, Any]) -> Optional[float]:
+    """
+    Return the publication time of a feed item as a UTC timestamp.
+    
+    Uses ``published_parsed`` (a ``struct_time``, or the list it becomes
+    after a JSON round trip) and falls back to an ISO 8601 ``published``.
+    """
+    parsed = item.get("published_parsed")
+    if parsed:
+        return float(calendar.timegm(tuple(parsed)[:6]))
+    
+    published = item.get("published")
+    if isinstance(published, str):
+        return parse_iso(published)
+    return None
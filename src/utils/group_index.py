@@ -0,0 +1,168 @@
+"""Inverted label and state index for resolving issue groups."""
+
+import heapq
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .dates import entry_timestamp, parse_iso
+
+
+def _newest_post(issue: Dict[str, Any]) -> Optional[float]:
+    timestamps = [entry_timestamp(item) for item in issue.get("rss") or []]
+    return max((timestamp for timestamp in timestamps if timestamp is not None), default=None)
+
+
+def _avatar_load_time(issue: Dict[str, Any]) -> Optional[float]:
+    # Failed probes report a load time of 0, which must not rank first
+    if issue.get("avatar_status") != "success":
+        return None
+    return issue.get("avatar_load_time")
+
+
+def _raw_date(field: str) -> Callable[[Dict[str, Any]], Optional[float]]:
+    def value(issue: Dict[str, Any]) -> Optional[float]:
+        date = issue.get("raw", {}).get(field)
+        return parse_iso(date) if isinstance(date, str) else None
+    return value
+
+
+# Group sort keys: how to compute them and whether they sort descending by default
+GROUP_SORT_KEYS: Dict[str, Tuple[Callable[[Dict[str, Any]], Optional[float]], bool]] = {
+    "feed": (_newest_post, True),
+    "avatar_load_time": (_avatar_load_time, False),
+    "created": (_raw_date("created_at"), True),
+    "updated": (_raw_date("updated_at"), True),
+}
+
+
+def parse_group_sort(sort_by: str) -> Tuple[str, bool]:
+    """
+    Split a group sort like ``feed`` or ``avatar_load_time-desc``.
+    
+    Returns:
+        The sort key and whether it sorts descending
+    
+    Raises:
+        ValueError: If the key or direction is unknown
+    """
+    field, _, direction = sort_by.partition("-")
+    if field not in GROUP_SORT_KEYS:
+        raise ValueError(f"Group sort key must be one of {set(GROUP_SORT_KEYS)}")
+    if direction not in ("", "asc", "desc"):
+        raise ValueError("Group sort direction must be 'asc' or 'desc'")
+    return field, GROUP_SORT_KEYS[field][1] if not direction else direction == "desc"
+
+
+class GroupIndex:
+    """
+    Map labels and states to bitsets of issue positions.
+    
+    The index is built in one pass over the issues; every group is then
+    resolved with a few integer AND/OR/NOT operations instead of rescanning
+    the issues and rebuilding their label sets per group.
+    """
+    
+    def __init__(self, issues: Sequence[Dict[str, Any]]):
+        """
+        Build the index.
+        
+        Args:
+            issues: Parsed issues, with the GitHub issue under ``raw``
+        """
+        self.issues = issues
+        self.size = len(issues)
+        self.everything = (1 << self.size) - 1
+        self.labels: Dict[str, int] = {}
+        self.states: Dict[str, int] = {}
+        self._sort_values: Dict[str, List[Optional[float]]] = {}
+        
+        for position, issue in enumerate(issues):
+            bit = 1 << position
+            raw = issue.get("raw", {})
+            state = raw.get("state")
+            if state is not None:
+                self.states[state] = self.states.get(state, 0) | bit
+            for label in raw.get("labels", []):
+                name = label["name"] if isinstance(label, dict) else label
+                self.labels[name] = self.labels.get(name, 0) | bit
+    
+    def select(
+        self,
+        state: str = "all",
+        labels: Iterable[str] = (),
+        any_labels: Iterable[str] = (),
+        exclude_labels: Iterable[str] = ()
+    ) -> List[int]:
+        """
+        Resolve a group to issue positions.
+        
+        Args:
+            state: Required issue state, or ``all``
+            labels: Labels an issue must all have
+            any_labels: Labels of which an issue must have at least one
+            exclude_labels: Labels an issue must not have
+        
+        Returns:
+            Matching positions in ascending order
+        """
+        mask = self.everything
+        if state != "all":
+            mask &= self.states.get(state, 0)
+        for label in labels:
+            mask &= self.labels.get(label, 0)
+        
+        any_labels = list(any_labels)
+        if any_labels:
+            alternatives = 0
+            for label in any_labels:
+                alternatives |= self.labels.get(label, 0)
+            mask &= alternatives
+        
+        for label in exclude_labels:
+            mask &= ~self.labels.get(label, 0)
+        
+        return self.positions(mask)
+    
+    def order(self, positions: List[int], sort_by: Optional[str] = None, limit: int = 0) -> List[int]:
+        """
+        Order group positions by a sort key and keep the first ``limit``.
+        
+        Key values are computed once per key for all issues and shared by
+        every group. With a limit, the top entries are picked with a bounded
+        heap instead of sorting the whole group. Issues without a value go
+        last; ties keep the original order.
+        
+        Args:
+            positions: Group positions in original order
+            sort_by: Sort key with an optional ``-asc``/``-desc`` suffix, or
+                None to keep the original order
+            limit: Maximum number of positions to return (0 for all)
+            
+        Returns:
+            Ordered positions
+        """
+        if not sort_by:
+            return positions[:limit] if limit > 0 else positions
+        
+        field, descending = parse_group_sort(sort_by)
+        values = self.sort_values(field)
+        sign = -1 if descending else 1
+        
+        def key(position: int) -> Tuple[bool, float, int]:
+            value = values[position]
+            return (value is None, 0 if value is None else sign * value, position)
+        
+        if 0 < limit < len(positions):
+            return heapq.nsmallest(limit, positions, key=key)
+        return sorted(positions, key=key)
+    
+    def sort_values(self, field: str) -> List[Optional[float]]:
+        """Value of a sort key for every issue, computed on first use."""
+        if field not in self._sort_values:
+            compute = GROUP_SORT_KEYS[field][0]
+            self._sort_values[field] = [compute(issue) for issue in self.issues]
+        return self._sort_values[field]
+    
+    @staticmethod
+    def positions(mask: int) -> List[int]:
+        """Positions of the set bits of ``mask``, lowest first."""
+        return [position for position, bit in enumerate(bin(mask)[:1:-1]) if bit == "1"]
@@ -0,0 +1,104 @@
+"""On-disk cache of HTTP validators and payloads for conditional requests."""
+
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Mapping, Optional, Union
+from urllib.parse import urlencode
+import logging
+
+from .json_store import load_json, dump_json_atomic
+
+logger = logging.getLogger(__name__)
+
+
+class HttpCache:
+    """
+    Store ETag/Last-Modified validators and decoded bodies per request URL.
+    
+    Entries are sent back as ``If-None-Match``/``If-Modified-Since`` headers;
+    a ``304 Not Modified`` answer is then served from the stored payload.
+    """
+    
+    # Response headers kept alongside the payload
+    STORED_HEADERS = ("ETag", "Last-Modified", "Link")
+    
+    def __init__(self, path: Union[str, Path], max_age: int = 7 * 24 * 3600):
+        """
+        Initialize the cache.
+        
+        Args:
+            path: JSON file backing the cache
+            max_age: Seconds after which an entry that was not used is dropped
+        """
+        self.path = Path(path)
+        self.max_age = max_age
+        self._entries: Dict[str, Dict[str, Any]] = load_json(self.path, default={})
+        self._lock = threading.Lock()
+        self._dirty = False
+    
+    @staticmethod
+    def key(url: str, params: Optional[Mapping[str, Any]] = None) -> str:
+        """Build the cache key for a URL and its query parameters."""
+        if not params:
+            return url
+        return f"{url}?{urlencode(sorted(params.items()))}"
+    
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached entry for ``key``, if any."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry["used_at"] = int(time.time())
+                self._dirty = True
+            return entry
+    
+    @staticmethod
+    def conditional_headers(entry: Optional[Dict[str, Any]]) -> Dict[str, str]:
+        """Build conditional request headers from a cached entry."""
+        if not entry:
+            return {}
+        
+        headers = {}
+        stored = entry.get("headers", {})
+        if stored.get("ETag"):
+            headers["If-None-Match"] = stored["ETag"]
+        if stored.get("Last-Modified"):
+            headers["If-Modified-Since"] = stored["Last-Modified"]
+        return headers
+    
+    def store(
+        self,
+        key: str,
+        headers: Mapping[str, Optional[str]],
+        body: Any,
+        require_validators: bool = True
+    ) -> None:
+        """
+        Remember a response for ``key``.
+        
+        By default responses without any validator are not cached, since
+        they could never be revalidated.
+        """
+        stored = {name: headers[name] for name in self.STORED_HEADERS if headers.get(name)}
+        if require_validators and "ETag" not in stored and "Last-Modified" not in stored:
+            return
+        
+        with self._lock:
+            self._entries[key] = {"headers": stored, "body": body, "used_at": int(time.time())}
+            self._dirty = True
+    
+    def save(self) -> None:
+        """Persist the cache if it changed, dropping entries unused for ``max_age``."""
+        with self._lock:
+            if not self._dirty:
+                return
+            
+            cutoff = time.time() - self.max_age
+            self._entries = {
+                key: entry for key, entry in self._entries.items()
+                if entry.get("used_at", 0) >= cutoff
+            }
+            dump_json_atomic(self.path, self._entries)
+            self._dirty = False
+        logger.debug(f"Saved HTTP cache to {self.path}")
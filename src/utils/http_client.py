@@ -0,0 +1,81 @@
+"""Shared pooled HTTP client."""
+
+import time
+from typing import Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+def create_session(
+    pool_size: int = 10,
+    max_hosts: int = 100,
+    retries: int = 1,
+    backoff_factor: float = 0.5
+) -> requests.Session:
+    """
+    Create a ``requests.Session`` shared by all services.
+    
+    The session keeps connections alive per host, so repeated requests to
+    the same host (GitHub, shared CDNs, a friend's homepage, feed and avatar)
+    skip the TCP and TLS handshakes. Idempotent requests are retried on
+    connection errors and 5xx responses with exponential backoff.
+    
+    Args:
+        pool_size: Connections kept alive per host
+        max_hosts: Number of per-host pools kept at the same time
+        retries: Retries for failed idempotent requests
+        backoff_factor: Base delay in seconds between retries
+        
+    Returns:
+        Configured session
+    """
+    # urllib3 < 1.26 (pinned through requests 2.22) calls it method_whitelist
+    methods_option = "allowed_methods" if hasattr(Retry, "DEFAULT_ALLOWED_METHODS") else "method_whitelist"
+    retry = Retry(
+        total=retries,
+        connect=retries,
+        read=retries,
+        status=retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=(500, 502, 503, 504),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+        **{methods_option: frozenset({"GET", "HEAD", "OPTIONS"})},
+    )
+    adapter = HTTPAdapter(
+        pool_connections=max_hosts,
+        pool_maxsize=pool_size,
+        max_retries=retry,
+    )
+    
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def read_bounded(response: requests.Response, max_bytes: int, timeout: float) -> Tuple[bytes, bool]:
+    """
+    Read a streamed response within a byte and time budget.
+    
+    Args:
+        response: Response opened with ``stream=True``
+        max_bytes: Maximum number of bytes to read
+        timeout: Seconds after which reading stops
+        
+    Returns:
+        The content read, cut to ``max_bytes``, and whether it is complete
+    """
+    deadline = time.monotonic() + timeout
+    chunks = []
+    size = 0
+    
+    for chunk in response.iter_content(chunk_size=16 * 1024):
+        chunks.append(chunk)
+        size += len(chunk)
+        if size > max_bytes or time.monotonic() > deadline:
+            return b"".join(chunks)[:max_bytes], False
+    
+    return b"".join(chunks), True
@@ -0,0 +1,117 @@
+"""Local snapshot of repository issues for incremental synchronisation."""
+
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+import logging
+
+from .json_store import load_json, dump_json_atomic
+
+logger = logging.getLogger(__name__)
+
+# Issue fields used for the configured sort orders
+SORT_FIELDS = {
+    "created": "created_at",
+    "updated": "updated_at",
+    "comments": "comments",
+}
+
+# Placeholder of the right type for issues missing a sort field
+SORT_DEFAULTS = {
+    "created_at": "",
+    "updated_at": "",
+    "comments": 0,
+}
+
+
+def sort_issues(issues: List[Dict[str, Any]], sort: str) -> List[Dict[str, Any]]:
+    """
+    Order issues the way the GitHub issues API does for ``sort``.
+    
+    The API sorts descending by default, so ``updated`` and ``updated-desc``
+    are equivalent; ties are broken by the newest issue number.
+    
+    Args:
+        issues: Issues to sort
+        sort: Configured sort order, e.g. ``created`` or ``updated-desc``
+        
+    Returns:
+        New list of issues in API order
+    """
+    field = SORT_FIELDS.get(sort.split("-", 1)[0], "created_at")
+    default = SORT_DEFAULTS.get(field, "")
+    
+    def key(issue: Dict[str, Any]) -> Tuple[bool, Any, int]:
+        value = issue.get(field)
+        # Issues without the field sort after all others, whatever its type
+        return (value is not None, default if value is None else value, issue.get("number", 0))
+    
+    return sorted(issues, key=key, reverse=True)
+
+
+class IssueSnapshot:
+    """
+    Issues of one repository keyed by number, persisted between runs.
+    
+    Only issues updated since the newest ``updated_at`` in the snapshot need
+    to be fetched; a full sync every ``full_sync_hours`` drops issues that
+    were deleted or transferred away.
+    """
+    
+    def __init__(self, path: Union[str, Path], repo: str, full_sync_hours: int = 24):
+        """
+        Initialize the snapshot.
+        
+        Args:
+            path: JSON file backing the snapshot
+            repo: Repository in format 'owner/repo'
+            full_sync_hours: Hours between complete re-downloads
+        """
+        self.path = Path(path)
+        self.repo = repo
+        self.full_sync_hours = full_sync_hours
+        
+        data = load_json(self.path, default={})
+        if data.get("repo") != repo:
+            data = {}
+        
+        self.full_sync_at: float = data.get("full_sync_at", 0)
+        self.issues: Dict[str, Dict[str, Any]] = data.get("issues", {})
+    
+    def since(self) -> Optional[str]:
+        """
+        Return the ``since`` timestamp for the next fetch.
+        
+        Returns:
+            ISO 8601 timestamp, or None when a full sync is due
+        """
+        if not self.issues or time.time() - self.full_sync_at >= self.full_sync_hours * 3600:
+            return None
+        
+        # GitHub's `since` is inclusive, so the newest issue is fetched again;
+        # that keeps us safe from issues updated within the same second.
+        return max(issue.get("updated_at") or "" for issue in self.issues.values()) or None
+    
+    def replace(self, issues: List[Dict[str, Any]]) -> None:
+        """Replace the snapshot with the result of a full sync."""
+        self.issues = {str(issue["number"]): issue for issue in issues}
+        self.full_sync_at = time.time()
+        logger.info(f"Full issue sync stored {len(self.issues)} issues")
+    
+    def merge(self, issues: List[Dict[str, Any]]) -> None:
+        """Merge issues fetched by an incremental sync into the snapshot."""
+        for issue in issues:
+            self.issues[str(issue["number"])] = issue
+        logger.info(f"Incremental issue sync merged {len(issues)} updated issues")
+    
+    def sorted_issues(self, sort: str) -> List[Dict[str, Any]]:
+        """Return all snapshot issues in API order for ``sort``."""
+        return sort_issues(list(self.issues.values()), sort)
+    
+    def save(self) -> None:
+        """Persist the snapshot."""
+        dump_json_atomic(self.path, {
+            "repo": self.repo,
+            "full_sync_at": self.full_sync_at,
+            "issues": self.issues,
+        })
@@ -0,0 +1,47 @@
+"""Helpers for small JSON files persisted between runs."""
+
+import json
+from pathlib import Path
+from typing import Any, Union
+import logging
+
+from .atomic_file import write_atomic
+
+logger = logging.getLogger(__name__)
+
+
+def load_json(path: Union[str, Path], default: Any = None) -> Any:
+    """
+    Load a JSON file, returning ``default`` if it is missing or unreadable.
+    
+    Args:
+        path: File to read
+        default: Value returned when the file cannot be loaded
+        
+    Returns:
+        Decoded JSON data or ``default``
+    """
+    path = Path(path)
+    if not path.exists():
+        return default
+    
+    try:
+        with open(path, "r", encoding="utf-8") as file:
+            return json.load(file)
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable cache file {path}: {e}")
+        return default
+
+
+def dump_json_atomic(path: Union[str, Path], data: Any) -> None:
+    """
+    Write JSON to ``path`` via a temporary file and rename.
+    
+    Readers never observe a half-written file, even if the run is killed
+    while writing.
+    
+    Args:
+        path: Destination file
+        data: JSON-serializable data
+    """
+    write_atomic(path, json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
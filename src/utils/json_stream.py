@@ -0,0 +1,69 @@
+"""Incremental JSON encoding of large output envelopes."""
+
+import json
+from typing import Any, Iterator, Optional, Tuple
+
+
+def iter_json(
+    data: Any,
+    indent: Optional[int] = None,
+    separators: Optional[Tuple[str, str]] = None,
+    stream_key: str = "content"
+) -> Iterator[str]:
+    """
+    Encode JSON in chunks, one item of ``data[stream_key]`` at a time.
+    
+    The joined chunks are identical to ``json.dumps(data, ensure_ascii=False,
+    indent=indent, separators=separators)``, but only a single envelope field
+    or content item is held as encoded text at any time.
+    
+    Args:
+        data: JSON-serializable data, typically a file envelope
+        indent: Indentation width, or None for a single line
+        separators: ``(item, key)`` separators as for ``json.dumps``
+        stream_key: Envelope field whose list or dict items are encoded
+            one by one
+    
+    Yields:
+        Encoded JSON text
+    """
+    if separators is None:
+        separators = (",", ": ") if indent is not None else (", ", ": ")
+    item_separator, key_separator = separators
+    
+    def encode(value: Any, depth: int) -> str:
+        text = json.dumps(value, ensure_ascii=False, indent=indent, separators=separators)
+        # Encoded strings never contain raw newlines, so this only shifts the layout
+        if indent is not None and depth:
+            text = text.replace("\n", "\n" + " " * (indent * depth))
+        return text
+    
+    def newline(depth: int) -> str:
+        return "" if indent is None else "\n" + " " * (indent * depth)
+    
+    def encode_key(key: Any) -> str:
+        return json.dumps(key if isinstance(key, str) else str(key), ensure_ascii=False) + key_separator
+    
+    if not isinstance(data, dict) or not isinstance(data.get(stream_key), (list, dict)):
+        yield encode(data, 0)
+        return
+    
+    yield "{"
+    for index, (key, value) in enumerate(data.items()):
+        yield (item_separator if index else "") + newline(1) + encode_key(key)
+        if key != stream_key:
+            yield encode(value, 1)
+        elif not value:
+            yield "[]" if isinstance(value, list) else "{}"
+        else:
+            opening, closing = ("[", "]") if isinstance(value, list) else ("{", "}")
+            yield opening
+            items = value if isinstance(value, list) else value.items()
+            for position, item in enumerate(items):
+                prefix = (item_separator if position else "") + newline(2)
+                if isinstance(value, dict):
+                    item_key, item = item
+                    prefix += encode_key(item_key)
+                yield prefix + encode(item, 2)
+            yield newline(1) + closing
+    yield newline(0) + "}"
@@ -0,0 +1,155 @@
+"""Persistent link health records with adaptive re-check intervals."""
+
+import random
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+from urllib.parse import urlsplit, urlunsplit
+import logging
+
+from .json_store import load_json, dump_json_atomic
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+def normalize_url(url: str) -> str:
+    """
+    Normalize a URL for use as a cache key.
+    
+    Lower-cases scheme and host, drops default ports and fragments and
+    treats an empty path as ``/``.
+    """
+    url = url.strip()
+    try:
+        parts = urlsplit(url)
+        port = parts.port
+    except ValueError:
+        return url
+    
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    if port and port != DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{port}"
+    return urlunsplit((scheme, host, parts.path or "/", parts.query, ""))
+
+
+class LinkHealthStore:
+    """
+    Last known status and latency per URL, persisted between runs.
+    
+    Healthy URLs are re-checked after ``ttl`` seconds, doubling with every
+    consecutive success up to ``max_ttl``. Failing URLs are re-checked after
+    ``retry_interval``, doubling with every consecutive failure up to ``ttl``.
+    """
+    
+    # Runs are scheduled, not exact; treat checks due this soon as due now
+    GRACE = 300
+    # Drop records of URLs that have not been checked for this long
+    EXPIRY = 30 * 24 * 3600
+    
+    def __init__(
+        self,
+        path: Union[str, Path],
+        ttl: int = 6 * 3600,
+        max_ttl: int = 48 * 3600,
+        retry_interval: int = 3600
+    ):
+        """
+        Initialize the store.
+        
+        Args:
+            path: JSON file backing the store
+            ttl: Base re-check interval in seconds for healthy URLs
+            max_ttl: Longest re-check interval in seconds
+            retry_interval: Base re-check interval in seconds for failing URLs
+        """
+        self.path = Path(path)
+        self.ttl = ttl
+        self.max_ttl = max_ttl
+        self.retry_interval = retry_interval
+        self._records: Dict[str, Dict[str, Any]] = load_json(self.path, default={})
+        self._lock = threading.Lock()
+        self._dirty = False
+    
+    def get_fresh(self, url: str) -> Optional[Dict[str, Any]]:
+        """
+        Return the record for ``url`` if it does not need re-checking yet.
+        
+        Args:
+            url: URL to look up
+            
+        Returns:
+            Record with ``status``, ``latency`` and ``checked_at``, or None
+        """
+        record = self.get(url)
+        if record and time.time() + self.GRACE < record.get("next_check_at", 0):
+            return record
+        return None
+    
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        """Return the last record for ``url``, however old it is."""
+        with self._lock:
+            return self._records.get(normalize_url(url))
+    
+    def record(self, url: str, status: str, latency: int, healthy: bool, **extra: Any) -> Dict[str, Any]:
+        """
+        Store the result of a check and schedule the next one.
+        
+        Extra fields of earlier records (e.g. discovered feed URLs) are
+        kept unless ``extra`` overrides them.
+        
+        Args:
+            url: URL that was checked
+            status: Status reported for the URL
+            latency: Check latency in milliseconds
+            healthy: Whether the check succeeded
+            **extra: Additional fields to keep with the record
+            
+        Returns:
+            The stored record
+        """
+        key = normalize_url(url)
+        now = time.time()
+        
+        with self._lock:
+            previous = self._records.get(key, {})
+            streak = previous.get("streak", 0) + 1 if previous.get("healthy") == healthy else 1
+            
+            if healthy:
+                interval = min(self.ttl * 2 ** (streak - 1), self.max_ttl)
+            else:
+                interval = min(self.retry_interval * 2 ** (streak - 1), self.ttl)
+            # Spread re-checks so URLs added together don't expire together
+            interval *= random.uniform(0.9, 1.1)
+            
+            record = dict(
+                previous,
+                **extra,
+                status=status,
+                latency=latency,
+                healthy=healthy,
+                streak=streak,
+                checked_at=int(now),
+                next_check_at=int(now + interval),
+            )
+            self._records[key] = record
+            self._dirty = True
+        return record
+    
+    def save(self) -> None:
+        """Persist the store, dropping records that expired long ago."""
+        with self._lock:
+            if not self._dirty:
+                return
+            
+            cutoff = time.time() - self.EXPIRY
+            self._records = {
+                key: record for key, record in self._records.items()
+                if record.get("checked_at", 0) >= cutoff
+            }
+            dump_json_atomic(self.path, self._records)
+            self._dirty = False
+        logger.debug(f"Saved link health records to {self.path}")
@@ -0,0 +1,237 @@
+"""Atomic writer for generated files that skips unchanged content."""
+
+import hashlib
+import zlib
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Tuple, Union
+import logging
+
+from .atomic_file import CHUNK_SIZE, AtomicFile, write_atomic
+from .json_stream import iter_json
+
+try:
+    import brotli
+except ImportError:  # brotli is optional; only gzip siblings are written without it
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+# Suffixes of the precompressed siblings the writer may produce
+SIBLING_SUFFIXES = (".gz", ".br")
+
+
+def _read_chunks(path: Path) -> Iterator[bytes]:
+    with open(path, "rb") as file:
+        while chunk := file.read(CHUNK_SIZE):
+            yield chunk
+
+
+def _chain_final(chunks: Iterable[bytes], finish: Callable[[], bytes]) -> Iterator[bytes]:
+    yield from chunks
+    yield finish()
+
+
+class OutputWriter:
+    """
+    Write generated files only when their content changed.
+    
+    Files are encoded incrementally and streamed to a temporary file while
+    being hashed, so memory use does not grow with the size of a file. The
+    temporary file replaces the existing one only if the SHA-256 differs;
+    unchanged files are not touched, so their modification time and the git
+    tree stay the same. The hashes of all written files are collected into a
+    manifest that CI and CDN caches can compare instead of the files
+    themselves.
+    
+    With ``compress`` enabled, gzip (and brotli, if installed) siblings are
+    written next to each file so static hosts can serve them directly.
+    Siblings that no longer match a written file are removed, so such hosts
+    never serve stale content. Files matching one of the ``managed`` patterns
+    that were not written by this run are removed as well.
+    """
+    
+    def __init__(
+        self,
+        output_dir: Union[str, Path],
+        manifest_name: str = "manifest.json",
+        minify: bool = False,
+        compress: bool = False,
+        managed: Iterable[str] = ()
+    ):
+        """
+        Initialize the writer.
+        
+        Args:
+            output_dir: Directory of the generated files
+            manifest_name: File name of the hash manifest inside ``output_dir``
+            minify: Write JSON without whitespace instead of indented
+            compress: Write precompressed ``.gz``/``.br`` siblings
+            managed: Glob patterns, relative to ``output_dir``, of files that
+                only exist while this writer produces them (e.g. pages)
+        """
+        self.output_dir = Path(output_dir)
+        self.manifest_name = manifest_name
+        self.minify = minify
+        self.compress = compress
+        self.managed = list(managed)
+        self.files: Dict[str, Dict[str, Any]] = {}
+        self.changed: List[str] = []
+        self.removed: List[str] = []
+    
+    def write_json(self, name: str, data: Any) -> bool:
+        """
+        Serialize data as JSON and write it if it changed.
+        
+        The ``content`` field is encoded one item at a time; the result is
+        the same as ``json.dumps`` with the writer's formatting.
+        
+        Args:
+            name: File path relative to the output directory
+            data: JSON-serializable data
+        
+        Returns:
+            Whether the file was written
+        """
+        if self.minify:
+            chunks = iter_json(data, separators=(",", ":"))
+        else:
+            chunks = iter_json(data, indent=4)
+        return self.write_chunks(name, (chunk.encode("utf-8") for chunk in chunks))
+    
+    def write_bytes(self, name: str, data: bytes, compress: bool = True) -> bool:
+        """
+        Write raw bytes if they differ from the file on disk.
+        
+        Args:
+            name: File path relative to the output directory
+            data: File content
+            compress: Whether the writer's precompressed siblings apply to
+                this file (off for content that is already compressed)
+        
+        Returns:
+            Whether the file was written
+        """
+        return self.write_chunks(name, [data], compress=compress)
+    
+    def write_chunks(self, name: str, chunks: Iterable[bytes], compress: bool = True) -> bool:
+        """
+        Stream content to disk and keep it only if it differs from the existing file.
+        
+        Args:
+            name: File path relative to the output directory
+            chunks: File content in chunks
+            compress: Whether the writer's precompressed siblings apply to
+                this file
+        
+        Returns:
+            Whether the file was written
+        """
+        path = self.output_dir / name
+        with AtomicFile(path) as file:
+            for chunk in chunks:
+                file.write(chunk)
+            
+            self.files[name] = {"sha256": file.hexdigest(), "bytes": file.size}
+            changed = self._file_digest(path) != self.files[name]["sha256"]
+            if not changed:
+                file.discard()
+        
+        if self.compress and compress:
+            self._write_siblings(path, missing_only=not changed)
+        else:
+            self._remove_siblings(path)
+        if not changed:
+            logger.debug(f"Unchanged, not rewriting: {path}")
+            return False
+        
+        self.changed.append(name)
+        return True
+    
+    def _write_siblings(self, path: Path, missing_only: bool = False) -> None:
+        """Write precompressed copies of a file, streamed from the file itself."""
+        compressors = self._compressors()
+        for suffix, (compress, finish) in compressors.items():
+            sibling = path.with_name(path.name + suffix)
+            if missing_only and sibling.exists():
+                continue
+            chunks = (compress(chunk) for chunk in _read_chunks(path))
+            write_atomic(sibling, _chain_final(chunks, finish))
+        # e.g. a .br left from a run that had brotli installed
+        self._remove_siblings(path, keep=compressors)
+    
+    def _remove_siblings(self, path: Path, keep: Iterable[str] = ()) -> None:
+        """Delete precompressed copies of a file, except those with a suffix in ``keep``."""
+        for suffix in SIBLING_SUFFIXES:
+            sibling = path.with_name(path.name + suffix)
+            if suffix not in keep and sibling.exists():
+                self._remove(sibling)
+    
+    def _remove(self, path: Path) -> None:
+        path.unlink()
+        self.removed.append(path.relative_to(self.output_dir).as_posix())
+        logger.debug(f"Removed stale output file: {path}")
+    
+    @staticmethod
+    def _compressors() -> Dict[str, Tuple[Callable[[bytes], bytes], Callable[[], bytes]]]:
+        """Streaming compressors by file suffix; the gzip header has no timestamp."""
+        gzip_stream = zlib.compressobj(9, zlib.DEFLATED, 31)
+        compressors = {".gz": (gzip_stream.compress, gzip_stream.flush)}
+        if brotli is not None:
+            brotli_stream = brotli.Compressor(quality=11)
+            compressors[".br"] = (brotli_stream.process, brotli_stream.finish)
+        return compressors
+    
+    def finish(self, **metadata: Any) -> bool:
+        """
+        Write the manifest of file hashes.
+        
+        The manifest holds no timestamps, so it is only rewritten when a
+        listed file or the metadata changed.
+        
+        Args:
+            **metadata: Extra top-level manifest fields, e.g. ``version``
+        
+        Returns:
+            Whether any file, including the manifest, changed or was removed
+        """
+        manifest = dict(metadata)
+        manifest["files"] = dict(sorted(self.files.items()))
+        self.write_json(self.manifest_name, manifest)
+        self._remove_unwritten()
+        self._remove_orphaned_siblings()
+        self.files.pop(self.manifest_name)
+        
+        logger.info(
+            f"{len(self.changed)} of {len(self.files)} output files changed, "
+            f"{len(self.removed)} stale files removed"
+        )
+        return bool(self.changed or self.removed)
+    
+    def _remove_unwritten(self) -> None:
+        """Delete managed files that were not written by this run, and directories they leave empty."""
+        for pattern in self.managed:
+            for path in self.output_dir.glob(pattern):
+                if path.is_file() and path.relative_to(self.output_dir).as_posix() not in self.files:
+                    self._remove(path)
+                    self._remove_siblings(path)
+                    if path.parent != self.output_dir and not any(path.parent.iterdir()):
+                        path.parent.rmdir()
+    
+    def _remove_orphaned_siblings(self) -> None:
+        """Delete precompressed copies of files that were not written by this run."""
+        for suffix in SIBLING_SUFFIXES:
+            for sibling in self.output_dir.rglob(f"*{suffix}"):
+                name = sibling.relative_to(self.output_dir).as_posix()[:-len(suffix)]
+                if name not in self.files:
+                    self._remove(sibling)
+    
+    @staticmethod
+    def _file_digest(path: Path) -> str:
+        """SHA-256 of a file, or an empty string if it cannot be read."""
+        digest = hashlib.sha256()
+        try:
+            for chunk in _read_chunks(path):
+                digest.update(chunk)
+        except OSError:
+            return ""
+        return digest.hexdigest()
@@ -0,0 +1,126 @@
+"""Text helpers for cleaning feed content."""
+
+import re
+import unicodedata
+from html import unescape
+from html.parser import HTMLParser
+from typing import Iterator, List
+
+ZWJ = "\u200d"
+_WHITESPACE = re.compile(r"\s+")
+
+
+class _TextExtractor(HTMLParser):
+    """Collect the text content of an HTML fragment."""
+    
+    SKIPPED_TAGS = {"script", "style", "template"}
+    
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.parts: List[str] = []
+        self._skipping = 0
+    
+    def handle_starttag(self, tag, attrs):
+        if tag in self.SKIPPED_TAGS:
+            self._skipping += 1
+        elif tag in ("br", "p", "div", "li"):
+            self.parts.append(" ")
+    
+    def handle_endtag(self, tag):
+        if tag in self.SKIPPED_TAGS and self._skipping:
+            self._skipping -= 1
+    
+    def handle_data(self, data):
+        if not self._skipping:
+            self.parts.append(data)
+
+
+def strip_html(html: str) -> str:
+    """
+    Convert an HTML fragment to plain text with collapsed whitespace.
+    
+    Args:
+        html: HTML fragment
+        
+    Returns:
+        Text content without tags, scripts or styles
+    """
+    if "<" not in html:
+        return _WHITESPACE.sub(" ", unescape(html)).strip()
+    
+    extractor = _TextExtractor()
+    extractor.feed(html)
+    extractor.close()
+    return _WHITESPACE.sub(" ", "".join(extractor.parts)).strip()
+
+
+def _extends_cluster(char: str) -> bool:
+    """Whether ``char`` continues the grapheme cluster before it."""
+    code = ord(char)
+    return (
+        unicodedata.category(char) in ("Mn", "Me", "Mc")
+        or char == ZWJ
+        or 0xFE00 <= code <= 0xFE0F          # variation selectors
+        or 0x1F3FB <= code <= 0x1F3FF        # emoji skin tone modifiers
+        or 0xE0020 <= code <= 0xE007F        # emoji tag sequences
+        or 0xE0100 <= code <= 0xE01EF        # variation selectors supplement
+    )
+
+
+def _is_regional_indicator(char: str) -> bool:
+    return 0x1F1E6 <= ord(char) <= 0x1F1FF
+
+
+def iter_graphemes(text: str) -> Iterator[str]:
+    """
+    Split text into user-perceived characters.
+    
+    Approximates the Unicode extended grapheme cluster rules that matter
+    for blog summaries: combining marks, ZWJ emoji sequences, variation
+    selectors, skin tone modifiers, flags and CRLF stay together.
+    """
+    start = 0
+    index = 1
+    length = len(text)
+    while start < length:
+        previous = text[start]
+        regional = 1 if _is_regional_indicator(previous) else 0
+        while index < length:
+            char = text[index]
+            if _extends_cluster(char) or previous == ZWJ:
+                pass
+            elif previous == "\r" and char == "\n":
+                pass
+            elif regional == 1 and _is_regional_indicator(char):
+                regional = 2
+            else:
+                break
+            previous = char
+            index += 1
+        yield text[start:index]
+        start = index
+        index += 1
+
+
+def truncate_graphemes(text: str, limit: int, ellipsis: str = "…") -> str:
+    """
+    Shorten text to at most ``limit`` user-perceived characters.
+    
+    Args:
+        text: Text to shorten
+        limit: Maximum number of grapheme clusters to keep
+        ellipsis: Appended when the text was shortened
+        
+    Returns:
+        The text itself if short enough, otherwise its first ``limit``
+        clusters followed by ``ellipsis``
+    """
+    if len(text) <= limit:
+        return text
+    
+    clusters = []
+    for cluster in iter_graphemes(text):
+        if len(clusters) == limit:
+            return "".join(clusters).rstrip() + ellipsis
+        clusters.append(cluster)
+    return text